@@ -0,0 +1,231 @@
+"""Offline benchmarks for the build pipeline on synthetic leagues.
+
+    python bench/run_bench.py                      # run + compare against bench/baseline.json
+    python bench/run_bench.py --save-baseline      # refresh the baseline
+    python bench/run_bench.py --teams 32 --seasons 3 --box-cache 20000
+
+Reports median throughput, peak traced memory and file sizes per benchmark and scale,
+and exits non-zero when a case regresses past --tolerance versus the baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import math
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import build_picks as bp  # noqa: E402
+import nhl_api  # noqa: E402
+from cache import load_json, save_json  # noqa: E402
+from synthetic import SyntheticLeague  # noqa: E402
+
+BASELINE_PATH = ROOT / "bench" / "baseline.json"
+
+MIN_SAMPLE_SECONDS = 0.10   # each timing sample loops a case for at least this long
+PEAK_SLACK_KB = 64          # peak-memory changes smaller than this are never flagged
+
+# name -> (teams, seasons, box cache entries)
+SCALES = {
+    "small": (16, 1, 500),
+    "full": (32, 2, 4000),
+}
+
+
+def _reference() -> float:
+    """Fixed pure-Python workload timed next to every sample to cancel machine drift."""
+    d = {i: float(i) for i in range(2000)}
+    acc = 0.0
+    for _ in range(20):
+        for k, v in d.items():
+            acc += v * 0.5 if k & 1 else -v
+    return acc
+
+
+def _loop_time(fn, loops: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - t0) / loops
+
+
+def _loops_for(fn) -> int:
+    t0 = time.perf_counter()
+    fn()
+    return max(1, math.ceil(MIN_SAMPLE_SECONDS / max(time.perf_counter() - t0, 1e-6)))
+
+
+def _timed(fn, repeat: int):
+    """Median per-call time over `repeat` samples, then one traced run for peak memory.
+
+    Each sample loops `fn` for at least MIN_SAMPLE_SECONDS and is paired with an
+    equally long run of _reference(); the median case/reference ratio (`rel`) is what
+    gets compared against the baseline, so a host that is uniformly slower or
+    faster for a few seconds does not read as a regression.
+    """
+    result = fn()
+    loops, ref_loops = _loops_for(fn), _loops_for(_reference)
+    secs, rel = [], []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t = _loop_time(fn, loops)
+            r = _loop_time(_reference, ref_loops)
+            secs.append(t)
+            rel.append(t / r)
+    finally:
+        gc.enable()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, statistics.median(secs), statistics.median(rel), peak
+
+
+def _case(name: str, scale: str, work: float, unit: str, timing: tuple, io_bytes: int = 0) -> dict:
+    secs, rel, peak = timing
+    return {
+        "name": name,
+        "scale": scale,
+        "work": work,
+        "throughput": work / secs if secs > 0 else 0.0,
+        "unit": unit,
+        "seconds": secs,
+        "rel": rel,
+        "peak_kb": peak / 1024.0,
+        "io_bytes": io_bytes,
+    }
+
+
+def run_scale(scale: str, teams: int, seasons: int, box_cache_size: int, repeat: int, tmp: Path) -> list[dict]:
+    league = SyntheticLeague(teams=teams, seasons=seasons)
+    league.install(nhl_api)
+    bp.STATE_PATH = tmp / "state.json"
+    bp.RATING_HISTORY_DIR = tmp
+    bp.CHECKPOINT_DIR = tmp
+    cases: list[dict] = []
+
+    # rebuild_ratings_to: cold rebuild of every generated season
+    def rebuild():
+        state = {"seasons": {}}
+        out = []
+        for i in range(seasons):
+            _, end = league.season_bounds(i)
+            out.append(bp.rebuild_ratings_to(end, state))
+        return out
+
+    results, *timing = _timed(rebuild, repeat)
+    finals = sum(int(note.split()[1]) for _, note, *_ in results if note.startswith("updated"))
+    cases.append(_case("rebuild_ratings_to", scale, finals, "games/s", timing, bp.STATE_PATH.stat().st_size))
+
+    ratings, _, logs, home_model = results[-1][:4]
+    _, end = league.season_bounds(-1)
+    today = end + timedelta(days=1)
+
+    # compute_form_and_rest over the last season's logs
+    n_logged = sum(len(v) for v in logs.values())
+    _, *timing = _timed(lambda: [bp.compute_form_and_rest(today, logs) for _ in range(20)], repeat)
+    cases.append(_case("compute_form_and_rest", scale, n_logged * 20, "games/s", timing))
+    form = bp.compute_form_and_rest(today, logs)
+
+    # top3_for_date across an 8-day window late in the season
+    days = [end - timedelta(days=8 - i) for i in range(8)]
+    n_slate = sum(len(league.get_schedule_for_date(d)) for d in days)
+    _, *timing = _timed(lambda: [bp.top3_for_date(d, ratings, form, home_model) for d in days], repeat)
+    cases.append(_case("top3_for_date", scale, n_slate, "games/s", timing))
+
+    # goalie_recent_sv for every team's usual starter, cache warmed with the newest boxscores
+    newest = sorted(league.boxscores)[-box_cache_size:]
+    warm = {str(gid): league.boxscores[gid] for gid in newest}
+
+    def recent_sv():
+        box_cache = dict(warm)
+        box_cache["_new_fetches"] = 0
+        return [bp.goalie_recent_sv(tid * 100 + 1, tid, today, box_cache, None) for tid in league.team_ids()]
+
+    found, *timing = _timed(recent_sv, repeat)
+    starts = sum(r[1] for r in found)
+    cases.append(_case("goalie_recent_sv", scale, starts, "starts/s", timing))
+
+    # cache.save_json / load_json round trip of the boxscore cache
+    path = tmp / "boxscore_cache.json"
+
+    def roundtrip():
+        save_json(path, warm)
+        return load_json(path, {})
+
+    _, *timing = _timed(roundtrip, repeat)
+    size = path.stat().st_size
+    cases.append(_case("cache_roundtrip", scale, size / 1e6, "MB/s", timing, size))
+
+    return cases
+
+
+def compare(cases: list[dict], baseline: dict, tol: float) -> list[str]:
+    flags = []
+    for c in cases:
+        b = baseline.get(f"{c['name']}@{c['scale']}")
+        if not b:
+            continue
+        label = f"{c['name']}@{c['scale']}"
+        if b.get("rel") and c["rel"] > b["rel"] / (1 - tol):
+            flags.append(f"{label}: throughput {c['throughput']:.0f} {c['unit']} is {b['rel'] / c['rel']:.0%} of baseline "
+                         f"(reference-normalised)")
+        if b["peak_kb"] > 0 and c["peak_kb"] > b["peak_kb"] * (1 + tol) + PEAK_SLACK_KB:
+            flags.append(f"{label}: peak {c['peak_kb']:.0f} KB > baseline {b['peak_kb']:.0f} KB")
+        if b["io_bytes"] > 0 and c["io_bytes"] > b["io_bytes"] * (1 + tol):
+            flags.append(f"{label}: file {c['io_bytes']} B > baseline {b['io_bytes']} B")
+    return flags
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--scale", action="append", choices=sorted(SCALES), help="preset scale(s); default: all")
+    ap.add_argument("--teams", type=int, help="custom scale: team count")
+    ap.add_argument("--seasons", type=int, default=1, help="custom scale: seasons")
+    ap.add_argument("--box-cache", type=int, default=1000, help="custom scale: boxscore cache entries")
+    ap.add_argument("--repeat", type=int, default=7, help="timing samples per case (median is reported)")
+    ap.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--tolerance", type=float, default=0.30, help="allowed fractional regression")
+    args = ap.parse_args()
+
+    if args.teams:
+        scales = {f"custom-{args.teams}t{args.seasons}s": (args.teams, args.seasons, args.box_cache)}
+    else:
+        scales = {k: SCALES[k] for k in (args.scale or SCALES)}
+
+    cases: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale, (teams, seasons, box) in scales.items():
+            cases.extend(run_scale(scale, teams, seasons, box, args.repeat, Path(tmp)))
+
+    print(f"{'benchmark':<24}{'scale':<18}{'throughput':>16}  {'unit':<9}{'peak KB':>10}{'file B':>12}")
+    for c in cases:
+        print(f"{c['name']:<24}{c['scale']:<18}{c['throughput']:>16,.0f}  {c['unit']:<9}{c['peak_kb']:>10,.0f}{c['io_bytes']:>12,}")
+
+    if args.save_baseline:
+        base = load_json(args.baseline, {})
+        base.update({f"{c['name']}@{c['scale']}": c for c in cases})
+        save_json(args.baseline, base)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    flags = compare(cases, load_json(args.baseline, {}), args.tolerance)
+    for f in flags:
+        print(f"REGRESSION {f}")
+    return 1 if flags else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+
+@dataclass
+class SyntheticLeague:
+    """Generated league shaped like the api-web.nhle.com payloads build_picks reads.
+
+    Teams get a hidden strength; scores are Poisson draws around it, so ratings and
+    form behave like a real season without any network access.
+    """
+    teams: int = 32
+    seasons: int = 1
+    games_per_team: int = 82
+    first_season: int = 2023
+    goalies_per_team: int = 2
+    seed: int = 7
+    games_by_day: Dict[date, List[dict]] = field(default_factory=dict)
+    boxscores: Dict[int, dict] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+        self._strength = {tid: self._rng.gauss(0.0, 0.25) for tid in self.team_ids()}
+        self._next_id = 1
+        for i in range(self.seasons):
+            self._generate_season(self.first_season + i)
+
+    def team_ids(self) -> List[int]:
+        return list(range(1, self.teams + 1))
+
+    def season_bounds(self, season_index: int = -1) -> tuple[date, date]:
+        year = self.first_season + (season_index % self.seasons)
+        return date(year, 10, 10), date(year + 1, 4, 15)
+
+    def total_games(self) -> int:
+        return sum(len(v) for v in self.games_by_day.values())
+
+    def _poisson(self, lam: float) -> int:
+        # Knuth; lam is ~3 so this is fast enough for generation
+        limit, k, p = math.exp(-lam), 0, 1.0
+        while True:
+            p *= self._rng.random()
+            if p <= limit:
+                return k
+            k += 1
+
+    def _team(self, tid: int, score: int | None) -> dict:
+        t = {"id": tid, "abbrev": f"T{tid:02d}", "name": f"Team {tid:02d}"}
+        if score is not None:
+            t["score"] = score
+        return t
+
+    def _goalie_line(self, pid: int, starter: bool, shots: int, goals: int) -> dict:
+        return {
+            "playerId": pid,
+            "starter": starter,
+            "toi": "60:00" if starter else "00:00",
+            "shotsAgainst": shots if starter else 0,
+            "goalsAgainst": goals if starter else 0,
+        }
+
+    def _goalies(self, tid: int, shots: int, goals: int) -> List[dict]:
+        starter = 1 if self._rng.random() < 0.7 else 2
+        return [
+            self._goalie_line(tid * 100 + k, k == starter, shots, goals)
+            for k in range(1, self.goalies_per_team + 1)
+        ]
+
+    def _generate_season(self, year: int) -> None:
+        start, end = date(year, 10, 10), date(year + 1, 4, 15)
+        days = (end - start).days + 1
+        per_day = max(1, round(self.teams * self.games_per_team / 2 / days))
+        per_day = min(per_day, self.teams // 2)
+        ids = self.team_ids()
+        for i in range(days):
+            day = start + timedelta(days=i)
+            self._rng.shuffle(ids)
+            slate = []
+            for k in range(per_day):
+                home, away = ids[2 * k], ids[2 * k + 1]
+                edge = self._strength[home] - self._strength[away] + 0.1
+                hg = self._poisson(3.0 * math.exp(edge / 2))
+                ag = self._poisson(3.0 * math.exp(-edge / 2))
+                kind = "REG"
+                if hg == ag:
+                    kind = "OT" if self._rng.random() < 0.7 else "SO"
+                    if self._rng.random() < 0.5 + edge / 4:
+                        hg += 1
+                    else:
+                        ag += 1
+                gid = self._next_id
+                self._next_id += 1
+                slate.append({
+                    "id": gid,
+                    "gameDate": day.isoformat(),
+                    "gameState": "OFF",
+                    "gameOutcome": {"lastPeriodType": kind},
+                    "homeTeam": self._team(home, hg),
+                    "awayTeam": self._team(away, ag),
+                })
+                h_shots, a_shots = 24 + self._poisson(6.0), 24 + self._poisson(6.0)
+                self.boxscores[gid] = {"playerByGameStats": {
+                    "homeTeam": {"goalies": self._goalies(home, a_shots, ag)},
+                    "awayTeam": {"goalies": self._goalies(away, h_shots, hg)},
+                }}
+            self.games_by_day[day] = slate
+
+    # --- nhl_api stand-ins ---
+    def get_games_range_weekly(self, start: date, end: date, deadline: Optional[float] = None) -> List[dict]:
+        out: List[dict] = []
+        d = start
+        while d <= end:
+            out.extend(self.games_by_day.get(d, []))
+            d += timedelta(days=1)
+        return out
+
+    def get_schedule_for_date(self, day: date) -> List[dict]:
+        return list(self.games_by_day.get(day, []))
+
+    def get_score_for_date(self, day: date) -> List[dict]:
+        return list(self.games_by_day.get(day, []))
+
+    def get_boxscore(self, game_id, session=None) -> dict:
+        return self.boxscores[int(game_id)]
+
+    def install(self, api) -> None:
+        """Point the nhl_api module at this league (no network)."""
+        api.get_games_range_weekly = self.get_games_range_weekly
+        api.get_schedule_for_date = self.get_schedule_for_date
+        api.get_score_for_date = self.get_score_for_date
+        api.get_boxscore = self.get_boxscore
@@ -1,4 +1,5 @@
 let DATA = null;
+let MODEL = null;
 
 function $(id){ return document.getElementById(id); }
 
@@ -18,17 +19,35 @@ function clearPicks(){
   $("empty").style.display = "none";
 }
 
+function renderWhatIf(p){
+  const w = p.goalie_whatif;
+  if (!w || !w.p_home || (w.p_home.length < 2 && (w.p_home[0] || []).length < 2)) return "";
+  const pickIsHome = p.pick_name === p.home_name;
+  const head = w.away.map(([id, pts]) => `<th title="${id}">A${id} (${pts >= 0 ? "+" : ""}${pts})</th>`).join("");
+  const rows = w.p_home.map((row, i) => {
+    const [id, pts] = w.home[i] || ["—", 0];
+    const cells = row.map(ph => `<td>${((pickIsHome ? ph : 1 - ph)*100).toFixed(1)}%</td>`).join("");
+    return `<tr><th>H${id} (${pts >= 0 ? "+" : ""}${pts})</th>${cells}</tr>`;
+  }).join("");
+  return `
+    <div class="whatif">
+      <div class="why-title">Goalie what-if (${p.pick_name} win %)</div>
+      <table class="whatif-grid"><tr><th></th>${head}</tr>${rows}</table>
+    </div>
+  `;
+}
+
 function renderPick(p){
   const li = document.createElement("li");
   li.className = "pick";
   li.innerHTML = `
     <div class="pick-top">
       <div class="matchup">${p.away_name} @ ${p.home_name}</div>
-      <div class="prob">${(p.win_prob*100).toFixed(1)}%</div>
+      <div class="prob">${(p.win_prob*100).toFixed(1)}%${p.win_prob_ci ? `<span class="ci"> (${(p.win_prob_ci[0]*100).toFixed(0)}–${(p.win_prob_ci[1]*100).toFixed(0)}%)</span>` : ""}</div>
     </div>
     <div class="pick-mid">
       <div class="winner">Pick: <strong>${p.pick_name}</strong></div>
-      <div class="meta">Elo: ${Math.round(p.home_elo)} / ${Math.round(p.away_elo)} · HomeAdv: ${p.home_adv ? Math.round(p.home_adv) : "—"}</div>
+      <div class="meta">Elo: ${Math.round(p.home_elo)} / ${Math.round(p.away_elo)} · HomeAdv: ${p.home_adv ? Math.round(p.home_adv) : "—"} · Calibrated: ${p.win_prob_cal != null ? (p.win_prob_cal*100).toFixed(1) + "%" : "—"}</div>
     </div>
     <div class="pick-bot">
       <div class="factors">${p.factors}</div>
@@ -39,12 +58,15 @@ function renderPick(p){
           <div class="why-row"><div class="why-k">Home ice</div><div class="why-v">${p.why.home_ice_pp.toFixed(1)} pp</div></div>
           <div class="why-row"><div class="why-k">Recent form (L10)</div><div class="why-v">${p.why.form_pp.toFixed(1)} pp</div></div>
           <div class="why-row"><div class="why-k">Back-to-back fatigue</div><div class="why-v">${p.why.fatigue_pp.toFixed(1)} pp</div></div>
+          <div class="why-row"><div class="why-k">Probable goalies</div><div class="why-v">${(p.why.goalie_pp || 0).toFixed(1)} pp</div></div>
           <div class="why-row why-total"><div class="why-k">Final</div><div class="why-v">${(p.why.final*100).toFixed(1)}%</div></div>
         </div>
         <div class="why-note">
           Home/Away form: ${p.form_home} / ${p.form_away} pts ·
-          Fatigue: ${p.fat_home} / ${p.fat_away} pts
+          Fatigue: ${p.fat_home} / ${p.fat_away} pts ·
+          Goalies: ${p.goalie_home || "+0"} / ${p.goalie_away || "+0"} pts
         </div>
+        ${renderWhatIf(p)}
       </div>
     </div>
   `;
@@ -77,6 +99,226 @@ function renderDate(d){
   }
 }
 
+function showDate(d){
+  renderDate(d);
+  renderSlate(d);
+}
+
+// --- Client-side scoring (port of elo.expected_home + build_picks.prob_shrink) ---
+
+function expectedHome(rHome, rAway, homeAdv, scale){
+  return 1.0 / (1.0 + Math.pow(10, (rAway - (rHome + homeAdv)) / scale));
+}
+
+function probShrink(p){
+  return 0.5 + (p - 0.5) * MODEL.prob_shrink;
+}
+
+function team(id){
+  const row = MODEL.teams[String(id)];
+  if (!row) return null;
+  const t = {id};
+  MODEL.fields.forEach((f, i) => { t[f] = row[i]; });
+  return t;
+}
+
+function scoreMatchup(homeId, awayId){
+  const h = team(homeId), a = team(awayId);
+  if (!h || !a) return null;
+  const home = h.elo + h.form_home + h.fatigue + h.goalie_pts;
+  const away = a.elo + a.form_away + a.fatigue + a.goalie_pts;
+  const pHome = probShrink(expectedHome(home, away, h.home_adv, MODEL.scale));
+  return {home: h, away: a, pHome};
+}
+
+function teamLabel(t){ return t.name || t.abbrev || `#${t.id}`; }
+
+function renderSlate(d){
+  const ol = $("slate");
+  ol.innerHTML = "";
+  if (!MODEL) return;
+  const rows = (MODEL.slates[d] || [])
+    .map(([gamePk, homeId, awayId]) => scoreMatchup(homeId, awayId))
+    .filter(Boolean)
+    .sort((x, y) => Math.max(y.pHome, 1 - y.pHome) - Math.max(x.pHome, 1 - x.pHome));
+  $("slateEmpty").style.display = rows.length ? "none" : "block";
+  for (const r of rows){
+    const pickHome = r.pHome >= 0.5;
+    const li = document.createElement("li");
+    li.className = "slate-row";
+    li.innerHTML = `
+      <span class="matchup">${teamLabel(r.away)} @ ${teamLabel(r.home)}</span>
+      <span class="meta">${teamLabel(pickHome ? r.home : r.away)}</span>
+      <span class="prob">${((pickHome ? r.pHome : 1 - r.pHome)*100).toFixed(1)}%</span>
+    `;
+    ol.appendChild(li);
+  }
+}
+
+function renderCustom(){
+  const r = scoreMatchup($("homeSel").value, $("awaySel").value);
+  if (!r || r.home.id === r.away.id){
+    $("customResult").textContent = "Pick two different teams.";
+    return;
+  }
+  $("customResult").textContent =
+    `${teamLabel(r.home)} ${(r.pHome*100).toFixed(1)}% · ${teamLabel(r.away)} ${((1 - r.pHome)*100).toFixed(1)}% ` +
+    `(HomeAdv ${Math.round(r.home.home_adv)}, form ${r.home.form_home.toFixed(0)}/${r.away.form_away.toFixed(0)}, ` +
+    `rest ${r.home.fatigue}/${r.away.fatigue}, G ${r.home.goalie_pts}/${r.away.goalie_pts})`;
+}
+
+// --- Ratings history (fixed-width float32 rows: one per day, `slots` teams each) ---
+
+let HISTORY = null;
+
+async function loadHistory(){
+  if (!MODEL || !MODEL.rating_history) return;
+  try{
+    const [m, b] = await Promise.all([
+      fetch(`./data/${MODEL.rating_history}.json`, {cache: "no-store"}),
+      fetch(`./data/${MODEL.rating_history}.f32`, {cache: "no-store"}),
+    ]);
+    if (!m.ok || !b.ok) return;
+    const meta = await m.json();
+    HISTORY = {meta, values: new Float32Array(await b.arrayBuffer())};
+  }catch(err){
+    HISTORY = null;
+    return;
+  }
+  const sel = $("historySel");
+  const teams = HISTORY.meta.teams.map(id => team(id) || {id}).sort((x, y) => teamLabel(x).localeCompare(teamLabel(y)));
+  sel.innerHTML = teams.map(t => `<option value="${t.id}">${teamLabel(t)}</option>`).join("");
+  sel.addEventListener("change", renderHistory);
+  $("historyCard").style.display = "block";
+  renderHistory();
+}
+
+function renderHistory(){
+  const {meta, values} = HISTORY;
+  const slot = meta.teams.indexOf(Number($("historySel").value));
+  const days = Math.floor(values.length / meta.slots);
+  const pts = [];
+  for (let i = 0; i < days; i++){
+    const v = values[i * meta.slots + slot];
+    if (!Number.isNaN(v)) pts.push([i, v]);
+  }
+  const svg = $("historyChart");
+  if (slot < 0 || pts.length < 2){
+    svg.innerHTML = "";
+    return;
+  }
+  const W = 600, H = 180, pad = 24;
+  const lo = Math.min(...pts.map(p => p[1])), hi = Math.max(...pts.map(p => p[1]));
+  const x = i => pad + (i / Math.max(1, days - 1)) * (W - 2 * pad);
+  const y = v => H - pad - ((v - lo) / Math.max(1, hi - lo)) * (H - 2 * pad);
+  const start = new Date(meta.start + "T00:00:00Z");
+  const label = i => new Date(start.getTime() + i * 86400000).toISOString().slice(0, 10);
+  const last = pts[pts.length - 1];
+  svg.innerHTML = `
+    <polyline class="history-line" points="${pts.map(([i, v]) => `${x(i).toFixed(1)},${y(v).toFixed(1)}`).join(" ")}" />
+    <text x="${pad}" y="14">${Math.round(hi)}</text>
+    <text x="${pad}" y="${H - 6}">${Math.round(lo)} · ${label(pts[0][0])}</text>
+    <text x="${W - pad}" y="${H - 6}" text-anchor="end">${label(last[0])}: ${Math.round(last[1])}</text>
+  `;
+}
+
+async function loadModel(){
+  try{
+    const r = await fetch("./data/model.json", {cache: "no-store"});
+    if (!r.ok) return;
+    MODEL = await r.json();
+  }catch(err){
+    MODEL = null;
+    return;
+  }
+  const teams = Object.keys(MODEL.teams).map(team).sort((x, y) => teamLabel(x).localeCompare(teamLabel(y)));
+  for (const id of ["homeSel", "awaySel"]){
+    const sel = $(id);
+    sel.innerHTML = teams.map(t => `<option value="${t.id}">${teamLabel(t)}</option>`).join("");
+    sel.addEventListener("change", renderCustom);
+  }
+  if (teams.length > 1) $("awaySel").value = String(teams[1].id);
+  $("slateCard").style.display = "block";
+  $("customCard").style.display = "block";
+  renderCustom();
+  loadHistory();
+}
+
+// --- Live odds (docs/data/live.json, written by scripts/live.py while it polls) ---
+
+const LIVE_REFRESH_MS = 15000;
+const LIVE_STALE_MS = 5 * 60 * 1000;
+
+function liveClock(g){
+  if (g.period === undefined) return g.state;
+  const left = g.overtime ? g.seconds_left : g.seconds_left - (3 - g.period) * 1200;
+  const mm = Math.floor(left / 60), ss = String(left % 60).padStart(2, "0");
+  return `${g.overtime ? "OT" : "P" + g.period} ${mm}:${ss}`;
+}
+
+const LIVE_MAX_MISSES = 4;   // consecutive 404s before polling stops (live.json is only written by a local live.py)
+let liveMisses = 0;
+
+// null = nothing usable this time (error, bad JSON); "missing" = this host does not serve live.json
+async function fetchLive(){
+  try{
+    const r = await fetch("./data/live.json", {cache: "no-store"});
+    if (r.status === 404) return "missing";
+    return r.ok ? await r.json() : null;
+  }catch(err){
+    return null;
+  }
+}
+
+// Keeps polling through errors and stale files; 404s back off and, after LIVE_MAX_MISSES in a row, stop
+async function loadLive(){
+  try{
+    const live = await fetchLive();
+    liveMisses = live === "missing" ? liveMisses + 1 : 0;
+    const fresh = live && live !== "missing" && Date.now() - new Date(live.generated_at).getTime() <= LIVE_STALE_MS && (live.games || []).length;
+    if (fresh){
+      $("liveAt").textContent = `Updated ${new Date(live.generated_at).toLocaleTimeString()}`;
+      $("live").innerHTML = live.games.map(g => `
+      <li class="slate-row">
+        <span class="matchup">${g.away} ${g.away_score} @ ${g.home} ${g.home_score} · ${liveClock(g)}</span>
+        <span class="prob">${g.home} ${(g.p_home * 100).toFixed(1)}% <span class="hint">(pre ${(g.p_home_pregame * 100).toFixed(0)}%)</span></span>
+      </li>`).join("");
+    }
+    $("liveCard").style.display = fresh ? "block" : "none";
+  }finally{
+    if (liveMisses < LIVE_MAX_MISSES) setTimeout(loadLive, LIVE_REFRESH_MS * 2 ** liveMisses);
+  }
+}
+
+// --- Track record (pre-aggregated by the build; no raw history is downloaded) ---
+
+function recordRows(label, rows){
+  const body = Object.entries(rows).map(([k, a]) => `
+    <tr><td>${k}</td><td>${a.hits}/${a.n}</td><td>${(a.hit_rate * 100).toFixed(1)}%</td><td>${(a.avg_p * 100).toFixed(1)}%</td><td>${a.brier.toFixed(3)}</td></tr>`).join("");
+  return `<tr><th>${label}</th><th>W/N</th><th>Hit</th><th>Expected</th><th>Brier</th></tr>${body}`;
+}
+
+async function loadTrackRecord(){
+  let rec;
+  try{
+    const r = await fetch("./data/track_record.json", {cache: "no-store"});
+    if (!r.ok) return;
+    rec = await r.json();
+  }catch(err){
+    return;
+  }
+  const o = rec.overall || {};
+  if (!o.n) return;
+  const s = rec.streak || {};
+  $("recordOverall").textContent =
+    `${o.hits}/${o.n} picks correct (${(o.hit_rate * 100).toFixed(1)}%, expected ${(o.avg_p * 100).toFixed(1)}%) · Brier ${o.brier.toFixed(3)} · through ${rec.updated_through}`;
+  $("recordStreak").textContent =
+    `${s.current >= 0 ? "W" : "L"}${Math.abs(s.current)} · best W${s.longest_win} · worst L${s.longest_loss}`;
+  $("recordMonths").innerHTML = recordRows("Month", rec.months || {});
+  $("recordBands").innerHTML = recordRows("Confidence", rec.bands || {});
+  $("recordCard").style.display = "block";
+}
+
 function nearestAvailableDate(desired){
   if (!DATA) return desired;
   const dates = DATA.dates || [];
@@ -103,19 +345,22 @@ async function load(){
       dateInput.max = dates[dates.length - 1];
     }
 
-    renderDate(initial);
+    await loadModel();
+    showDate(initial);
+    loadTrackRecord();
+    loadLive();
 
     $("btn").addEventListener("click", (e)=>{
       e.preventDefault();
       const d = dateInput.value;
       if (!d) return;
-      renderDate(nearestAvailableDate(d));
+      showDate(nearestAvailableDate(d));
     });
 
     dateInput.addEventListener("change", ()=>{
       const d = dateInput.value;
       if (!d) return;
-      renderDate(nearestAvailableDate(d));
+      showDate(nearestAvailableDate(d));
     });
 
   }catch(err){
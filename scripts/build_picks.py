@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 
+import copy
+import hashlib
 import json
+import numpy as np
 import requests
+import time
+from dataclasses import asdict, dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from dateutil.tz import tzutc
@@ -10,6 +15,16 @@ from dateutil.tz import tzutc
 from elo import EloConfig, expected_home, update_ratings
 import nhl_api
 from cache import load_json, save_json
+from calibration import build_table, lut_lookup
+from pipeline import Stage, StageError, run_stages
+from rating_history import RatingHistory
+from series import pairing_table
+from track_record import VERSION as TRACK_RECORD_VERSION, load_record, publish, roll_up
+import uncertainty
+from goalies import (
+    LEAGUE_AVG_SV, MAX_ADJ_PTS, PTS_PER_010_SV,
+    GoalieProfile, parse_goalie_leaders, team_goalie_candidates, goalie_adjustment_points,
+)
 
 CFG = EloConfig()
 
@@ -43,30 +58,70 @@ GOALIE_RECENT_STARTS = 5
 GOALIE_LOOKBACK_DAYS = 35  # max days to search for recent starts
 GOALIE_MAX_NEW_BOXSCORES_PER_RUN = 120
 
-# Calibration bins
-CAL_BIN_SIZE = 0.05
-CAL_MIN = 0.30
-CAL_MAX = 0.85
+# Goalie adjustment + what-if table
+USE_GOALIE_ADJ = True
+GOALIE_WHATIF_CANDIDATES = 3  # plausible starters per team scored in the what-if grid
+
+# Calibration (isotonic tables are refit from pick history on every run)
 CAL_MAX_HISTORY = 2500
 
 # Probability shrink
 PROB_SHRINK = 0.85
 
+# Bootstrap intervals on win_prob (form logs, home-adv and goalie SV% resampled)
+BOOTSTRAP_SAMPLES = 2000
+BOOTSTRAP_LEVEL = 0.90
+BOOTSTRAP_SEED = 20240501
+HOME_RES_SD_PRIOR = 0.45      # per-game home residual SD until the spread window covers 2+ games (n_sq)
+GOALIE_SHOTS_PER_GAME = 28.0  # converts GP into an SV% sample size
+
+# Playoff series odds (series.json) are exported in these months
+SERIES_EXPORT_MONTHS = (3, 4, 5, 6)
+
 # Rate-limit safety on first run
 MAX_REBUILD_DAYS = 180
 
+# Late score / OT-SO corrections: re-check this many processed days each run and
+# replay from the nearest stored checkpoint (one every N days, last K kept)
+CORRECTION_LOOKBACK_DAYS = 14
+CHECKPOINT_EVERY_DAYS = 7
+CHECKPOINT_KEEP = 3
+
+@dataclass(frozen=True)
+class ModelConfig:
+    name: str
+    prob_shrink: float = PROB_SHRINK
+    learned_home: bool = True   # False -> flat H_HOME_BASE for every team
+    goalie_adj: bool = USE_GOALIE_ADJ
+    weight: float = 1.0         # share in the blended probability
+
+# Ensemble: every model is scored from the same fetched finals in one pass. Models that
+# only differ at scoring time (prob_shrink, goalie_adj) share one rating track.
+# The primary model drives the published pick; the rest are reported alongside.
+PRIMARY_MODEL = "main"
+ENSEMBLE_MODELS = [
+    ModelConfig(PRIMARY_MODEL),
+    ModelConfig("no_goalie", goalie_adj=False),
+    ModelConfig("flat_home", learned_home=False),
+    ModelConfig("shrink_75", prob_shrink=0.75),
+]
+
 STATE_PATH = Path("docs/data/state.json")
 BOX_CACHE_PATH = Path("docs/data/boxscore_cache.json")
 PICK_HISTORY_PATH = Path("docs/data/pick_history.json")
-CALIBRATION_PATH = Path("docs/data/calibration.json")
+TRACK_RECORD_PATH = Path("docs/data/track_record.json")
 
 PICKS_PATH = Path("docs/data/picks.json")
+MODEL_BUNDLE_PATH = Path("docs/data/model.json")
+SERIES_PATH = Path("docs/data/series.json")
+RATING_HISTORY_DIR = Path("docs/data")  # ratings_<season>.f32 + .json
+CHECKPOINT_DIR = Path("docs/data")      # checkpoints_<season>.json (replay checkpoints)
 
 def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
-def prob_shrink(p: float) -> float:
-    return 0.5 + (p - 0.5) * PROB_SHRINK
+def prob_shrink(p: float, shrink: float | None = None) -> float:
+    return 0.5 + (p - 0.5) * (PROB_SHRINK if shrink is None else shrink)
 
 def season_from_date(d: date) -> str:
     if d.month >= 9:
@@ -78,14 +133,46 @@ def season_from_date(d: date) -> str:
 def season_start_guess(season: str) -> date:
     return date(int(season[:4]), 10, 1)
 
+def _checkpoint_path(season: str) -> Path:
+    return CHECKPOINT_DIR / f"checkpoints_{season}.json"
+
 def load_state() -> dict:
-    if STATE_PATH.exists():
-        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
-    return {"seasons": {}}
+    if not STATE_PATH.exists():
+        return {"seasons": {}}
+    state = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    for season, sstate in state.get("seasons", {}).items():
+        if "checkpoints" not in sstate:
+            cps = load_json(_checkpoint_path(season), None)
+            if cps:
+                sstate["checkpoints"] = cps
+    return state
 
 def save_state(state: dict) -> None:
+    """Write state.json; each season's replay checkpoints go to their own compact file,
+    rewritten only when they change (weekly), so the daily state.json diff stays small."""
     STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    STATE_PATH.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    slim = {**state, "seasons": {}}
+    for season, sstate in state.get("seasons", {}).items():
+        path = _checkpoint_path(season)
+        cps = sstate.get("checkpoints")
+        if cps:
+            text = json.dumps(cps, separators=(",", ":"))
+            if not path.exists() or path.read_text(encoding="utf-8") != text:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(text, encoding="utf-8")
+        elif path.exists():
+            path.unlink()
+        slim["seasons"][season] = {k: v for k, v in sstate.items() if k != "checkpoints"}
+    STATE_PATH.write_text(json.dumps(slim, separators=(",", ":")), encoding="utf-8")
+
+def load_goalie_profiles(state: dict) -> dict[int, GoalieProfile]:
+    out: dict[int, GoalieProfile] = {}
+    for row in (state.get("goalies") or {}).get("profiles", []):
+        try:
+            out[int(row["player_id"])] = GoalieProfile(**row)
+        except Exception:
+            continue
+    return out
 
 def s_home_from_outcome(home_won: bool, kind: str) -> float:
     if not home_won:
@@ -109,34 +196,104 @@ def update_home_model(team_id: int, residual_home: float, home_model: dict) -> N
     s = home_model.get(str(team_id), {"res_sum": 0.0, "n": 0})
     s["res_sum"] = float(s.get("res_sum", 0.0)) + float(residual_home)
     s["n"] = int(s.get("n", 0)) + 1
+    # The spread window (res_sum_w, res_sq over n_sq games) started later than res_sum/n
+    # in older states, so it keeps its own sums; one without res_sum_w restarts cleanly
+    if "res_sum_w" not in s:
+        s["res_sq"], s["n_sq"] = 0.0, 0
+    s["res_sum_w"] = float(s.get("res_sum_w", 0.0)) + float(residual_home)
+    s["res_sq"] = float(s.get("res_sq", 0.0)) + float(residual_home) ** 2
+    s["n_sq"] = int(s.get("n_sq", 0)) + 1
     home_model[str(team_id)] = s
 
-def rebuild_ratings_to(target: date, state: dict):
-    season = season_from_date(target)
-    seasons = state["seasons"]
-    sstate = seasons.get(season)
+def _home_res_var(s: dict) -> float:
+    """Per-game home residual variance over the n_sq window (mean and squares from the same
+    games); the prior until that window holds 2+ games."""
+    k = int(s.get("n_sq", 0))
+    if k < 2 or "res_sum_w" not in s:
+        return HOME_RES_SD_PRIOR ** 2
+    m = float(s["res_sum_w"]) / k
+    return max(0.0, float(s["res_sq"]) / k - m * m)
+
+def _model_home_adv(model: ModelConfig, team_id: int, home_model: dict) -> float:
+    return get_team_home_adv(team_id, home_model) if model.learned_home else H_HOME_BASE
+
+def _with_primary(models: list[ModelConfig] | None) -> list[ModelConfig]:
+    models = list(models or ENSEMBLE_MODELS)
+    if PRIMARY_MODEL not in [m.name for m in models]:
+        models = [ModelConfig(PRIMARY_MODEL)] + models
+    return sorted(models, key=lambda m: m.name != PRIMARY_MODEL)
+
+def _track_key(model: ModelConfig, models: list[ModelConfig]) -> str:
+    """Rating track a model reads: named after the first model (primary first) with the same
+    rating parameters. Only learned_home changes the Elo updates; prob_shrink and goalie_adj
+    are applied at scoring time."""
+    return next(m.name for m in models if m.learned_home == model.learned_home)
+
+def _load_track(key: str, learned_home: bool, sstate: dict) -> dict:
+    """One rating track. The primary model's track keeps the top-level season keys."""
+    if key == PRIMARY_MODEL:
+        src = sstate
+    else:
+        src = sstate.setdefault("variants", {}).setdefault(key, {"last_built": None, "ratings": {}, "home_model": {}})
+    return {
+        "learned_home": learned_home,
+        "src": src,
+        "ratings": {int(k): float(v) for k, v in (src.get("ratings") or {}).items()},
+        "home_model": src.get("home_model") or {},
+        "logs": decode_team_logs(src.get("team_logs")),
+        "updates": 0,
+    }
 
-    if not sstate:
-        sstate = {"last_built": None, "ratings": {}, "home_model": {}}
-        seasons[season] = sstate
+def _apply_final(track: dict, home_id: int, away_id: int, home_goals: int, away_goals: int, kind: str, game_day: date, log_start: date) -> None:
+    ratings = track["ratings"]
+    home_model = track["home_model"]
+    per_team_logs = track["logs"]
 
-    ratings = {int(k): float(v) for k, v in (sstate.get("ratings") or {}).items()}
-    home_model = sstate.get("home_model") or {}
+    if home_id not in ratings: ratings[home_id] = CFG.base_rating
+    if away_id not in ratings: ratings[away_id] = CFG.base_rating
 
-    if sstate.get("last_built"):
-        start = date.fromisoformat(sstate["last_built"]) + timedelta(days=1)
-    else:
-        season_start = season_start_guess(season)
-        start = max(season_start, target - timedelta(days=MAX_REBUILD_DAYS))
+    r_home_pre = ratings[home_id]
+    r_away_pre = ratings[away_id]
 
-    if start > target:
-        return ratings, "cached", {}, home_model
+    # Team-specific home advantage for expectation + Elo update
+    h_team = get_team_home_adv(home_id, home_model) if track["learned_home"] else H_HOME_BASE
+    cfg_game = EloConfig(base_rating=CFG.base_rating, home_ice_adv=h_team, scale=CFG.scale)
 
-    log_start = target - timedelta(days=60)
-    per_team_logs: dict[int, list[dict]] = {}
+    e_home = expected_home(r_home_pre, r_away_pre, cfg_game)
+
+    home_won = home_goals > away_goals
+    s_home = s_home_from_outcome(home_won, kind)
+
+    residual_home = s_home - e_home
+    residual_away = -residual_home
+
+    if track["learned_home"]:
+        update_home_model(home_id, residual_home, home_model)
+
+    if game_day >= log_start:
+        per_team_logs.setdefault(home_id, []).append({
+            "date": game_day.isoformat(),
+            "is_home": True,
+            "residual": float(residual_home),
+            "gd": int(home_goals - away_goals),
+        })
+        per_team_logs.setdefault(away_id, []).append({
+            "date": game_day.isoformat(),
+            "is_home": False,
+            "residual": float(residual_away),
+            "gd": int(away_goals - home_goals),
+        })
 
-    updates = 0
-    games = nhl_api.get_games_range_weekly(start, target)
+    new_home, new_away, *_ = update_ratings(
+        r_home_pre, r_away_pre, s_home, abs(home_goals - away_goals), game_day, cfg_game
+    )
+    ratings[home_id] = new_home
+    ratings[away_id] = new_away
+    track["updates"] += 1
+
+def _decode_finals(games: list[dict], teams: dict) -> list[tuple]:
+    """Reduce fetched games to (game_id, day, home_id, away_id, home_goals, away_goals, kind) finals."""
+    out = []
     for g in games:
             if not nhl_api.is_final(g):
                 continue
@@ -148,8 +305,7 @@ def rebuild_ratings_to(target: date, state: dict):
                 continue
 
             home_goals, away_goals = score
-            gd = abs(home_goals - away_goals)
-            if gd == 0:
+            if home_goals == away_goals:
                 continue
 
             home_id = basic["home_team_id"]
@@ -157,55 +313,209 @@ def rebuild_ratings_to(target: date, state: dict):
             if home_id is None or away_id is None:
                 continue
 
-            if home_id not in ratings: ratings[home_id] = CFG.base_rating
-            if away_id not in ratings: ratings[away_id] = CFG.base_rating
+            for side in ("home", "away"):
+                if basic.get(f"{side}_team_abbrev"):
+                    teams[str(basic[f"{side}_team_id"])] = {"abbrev": basic[f"{side}_team_abbrev"], "name": basic[f"{side}_team_name"]}
 
-            r_home_pre = ratings[home_id]
-            r_away_pre = ratings[away_id]
+            game_day = date.fromisoformat(basic["date"])
+            out.append((str(basic["gamePk"]), game_day, home_id, away_id, home_goals, away_goals, nhl_api.final_kind(g)))
+    return out
 
-            # Team-specific home advantage for expectation + Elo update
-            h_team = get_team_home_adv(home_id, home_model)
-            cfg_game = EloConfig(base_rating=CFG.base_rating, home_ice_adv=h_team, scale=CFG.scale)
+def _final_hash(final: tuple) -> str:
+    gid, day, home_id, away_id, home_goals, away_goals, kind = final
+    raw = f"{day.isoformat()}|{home_id}|{away_id}|{home_goals}|{away_goals}|{kind}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
 
-            e_home = expected_home(r_home_pre, r_away_pre, cfg_game)
+def encode_team_logs(logs: dict[int, list[dict]], keep: int = 10) -> dict[str, list[list]]:
+    """Last `keep` games per team as [date, is_home, residual, gd] rows (how state and
+    checkpoint files store logs; compute_form_and_rest reads no more than 10)."""
+    return {
+        str(tid): [[e["date"], int(e["is_home"]), e["residual"], e["gd"]] for e in sorted(gs, key=lambda x: x["date"])[-keep:]]
+        for tid, gs in logs.items()
+    }
+
+def decode_team_logs(raw: dict | None) -> dict[int, list[dict]]:
+    """Inverse of encode_team_logs; also accepts the older one-dict-per-game layout."""
+    return {
+        int(k): [e if isinstance(e, dict) else {"date": e[0], "is_home": bool(e[1]), "residual": e[2], "gd": e[3]} for e in v]
+        for k, v in (raw or {}).items()
+    }
+
+def _snapshot_track(t: dict) -> dict:
+    return {
+        "ratings": {str(k): float(v) for k, v in t["ratings"].items()},
+        "home_model": {k: dict(v) for k, v in t["home_model"].items()},
+        "team_logs": encode_team_logs(t["logs"]),
+    }
+
+def _checkpoint(day: date, tracks: dict) -> dict:
+    """Every rating track's state before `day`."""
+    return {"date": day.isoformat(), "tracks": {key: _snapshot_track(t) for key, t in tracks.items()}}
+
+def _restore_track(t: dict, snap: dict | None) -> None:
+    snap = snap or {}
+    t["ratings"] = {int(k): float(v) for k, v in (snap.get("ratings") or {}).items()}
+    t["home_model"] = {k: dict(v) for k, v in (snap.get("home_model") or {}).items()}
+    t["logs"] = decode_team_logs(snap.get("team_logs"))
+
+def _model_views(models: list[ModelConfig], tracks: dict) -> dict:
+    """Per-model view of the shared rating tracks, keyed by model name (what scoring reads)."""
+    views = {}
+    for m in models:
+        key = _track_key(m, models)
+        t = tracks[key]
+        views[m.name] = {"model": m, "key": key, "ratings": t["ratings"], "home_model": t["home_model"], "logs": t["logs"]}
+    return views
+
+def rebuild_ratings_to(target: date, state: dict, models: list[ModelConfig] | None = None,
+                       deadline: float | None = None, save: bool = True):
+    """Bring every model's ratings up to `target` from one shared fetch of finals.
+
+    Finals from the last CORRECTION_LOOKBACK_DAYS are re-fetched and compared with the
+    content hashes stored when they were processed; if the league corrected any of
+    them, every model is restored from the nearest checkpoint before the earliest
+    change and replayed from there instead of rebuilding the season.
+
+    `deadline` (time.monotonic()) bounds the fetch and replay: past it, TimeoutError is
+    raised before the rating history is truncated or written. With save=False, `state`
+    is updated in memory only and the caller decides whether to persist it; the rating
+    history is still written once the last deadline check has passed.
+
+    Returns the primary model's (ratings, note, logs, home_model) plus `tracks`,
+    keyed by model name, each a view of its rating track's ratings/home_model/logs.
+    """
+    season = season_from_date(target)
+    seasons = state["seasons"]
+    sstate = seasons.get(season)
 
-            home_won = home_goals > away_goals
-            kind = nhl_api.final_kind(g)
-            s_home = s_home_from_outcome(home_won, kind)
+    if not sstate:
+        sstate = {"last_built": None, "ratings": {}, "home_model": {}}
+        seasons[season] = sstate
 
-            residual_home = s_home - e_home
-            residual_away = -residual_home
+    # Finished seasons are never replayed or scored: keep only their final ratings/home model
+    for other, old in seasons.items():
+        if other < season:
+            for key in ("checkpoints", "finals", "finals_since", "team_logs"):
+                old.pop(key, None)
+            for variant in (old.get("variants") or {}).values():
+                variant.pop("team_logs", None)
+
+    models = _with_primary(models)
+    keys = {_track_key(m, models): m.learned_home for m in models}
+    tracks = {key: _load_track(key, learned_home, sstate) for key, learned_home in keys.items()}
+    # Drop tracks no longer read by any model (e.g. older per-model copies)
+    for key in [k for k in sstate.get("variants") or {} if k not in keys]:
+        del sstate["variants"][key]
+
+    season_start = season_start_guess(season)
+    cold_start = max(season_start, target - timedelta(days=MAX_REBUILD_DAYS))
+    for t in tracks.values():
+        lb = t["src"].get("last_built")
+        t["start"] = date.fromisoformat(lb) + timedelta(days=1) if lb else cold_start
 
-            update_home_model(home_id, residual_home, home_model)
+    log_start = target - timedelta(days=60)
+    for t in tracks.values():
+        t["logs"] = {tid: [e for e in gs if e["date"] >= log_start.isoformat()] for tid, gs in t["logs"].items()}
 
-            game_day = date.fromisoformat(basic["date"])
-            if game_day >= log_start:
-                per_team_logs.setdefault(home_id, []).append({
-                    "date": game_day.isoformat(),
-                    "is_home": True,
-                    "residual": float(residual_home),
-                    "gd": int(home_goals - away_goals),
-                })
-                per_team_logs.setdefault(away_id, []).append({
-                    "date": game_day.isoformat(),
-                    "is_home": False,
-                    "residual": float(residual_away),
-                    "gd": int(away_goals - home_goals),
-                })
-
-            new_home, new_away, *_ = update_ratings(
-                r_home_pre, r_away_pre, s_home, gd, game_day, cfg_game
-            )
-            ratings[home_id] = new_home
-            ratings[away_id] = new_away
-            updates += 1
-
-    sstate["ratings"] = {str(k): float(v) for k, v in ratings.items()}
-    sstate["last_built"] = target.isoformat()
-    sstate["home_model"] = home_model
-    save_state(state)
+    primary = tracks[PRIMARY_MODEL]
+    start = min(t["start"] for t in tracks.values())
+    if start > target:
+        return primary["ratings"], "cached", primary["logs"], primary["home_model"], _model_views(models, tracks)
+
+    teams = state.setdefault("teams", {})
+    seen: dict[str, list] = sstate.setdefault("finals", {})  # game id -> [date, content hash]
+    seen_since = sstate.setdefault("finals_since", primary["start"].isoformat())
+
+    # Re-fetch a short window of already-processed days to catch score/OT/SO corrections
+    fetch_start = min(start, max(season_start, primary["start"] - timedelta(days=CORRECTION_LOOKBACK_DAYS)))
+    finals = _decode_finals(nhl_api.get_games_range_weekly(fetch_start, target, deadline=deadline), teams)
+
+    changed = [
+        f for f in finals
+        if f[1] < primary["start"] and (
+            (f[0] in seen and seen[f[0]][1] != _final_hash(f))
+            or (f[0] not in seen and f[1].isoformat() >= seen_since)
+        )
+    ]
+    replay_note = ""
+    truncate_from = None
+    if changed:
+        earliest = min(f[1] for f in changed)
+        checkpoints = [c for c in sstate.get("checkpoints", []) if c["date"] <= earliest.isoformat()]
+        cp = checkpoints[-1] if checkpoints else None
+        replay_from = date.fromisoformat(cp["date"]) if cp else cold_start
+        cp_tracks = (cp or {}).get("tracks", {})
+        for key, t in tracks.items():
+            snap = cp_tracks.get(key)
+            if isinstance(snap, str):  # older checkpoints aliased identical per-model copies
+                snap = cp_tracks.get(snap)
+            _restore_track(t, snap)
+            t["updates"] = 0
+            t["start"] = replay_from if snap else cold_start
+        sstate["checkpoints"] = checkpoints
+        for gid in [k for k, v in seen.items() if v[0] >= replay_from.isoformat()]:
+            del seen[gid]
+        start = min(t["start"] for t in tracks.values())
+        if start < fetch_start:
+            finals = _decode_finals(nhl_api.get_games_range_weekly(start, fetch_start - timedelta(days=1), deadline=deadline), teams) + finals
+        truncate_from = start
+        replay_note = f"; replayed from {start.isoformat()} after {len(changed)} corrected finals"
+
+    snapshots: dict[date, dict[int, float]] = {}  # primary model, end of each game day
+    prev_day = None
+    checkpoints = sstate.setdefault("checkpoints", [])
+    # Only the last CHECKPOINT_KEEP checkpoints and the lookback window's hashes survive the
+    # run, so a long (cold) rebuild skips snapshots and hashes that would be pruned anyway
+    checkpoint_from = target - timedelta(days=CHECKPOINT_EVERY_DAYS * (CHECKPOINT_KEEP + 1))
+    keep_from = target + timedelta(days=1) - timedelta(days=CORRECTION_LOOKBACK_DAYS)
+
+    for f in finals:
+        gid, game_day, home_id, away_id, home_goals, away_goals, kind = f
+        if game_day >= keep_from:
+            seen[gid] = [game_day.isoformat(), _final_hash(f)]
+        if game_day < start:
+            continue
 
-    return ratings, f"updated {updates} finals", per_team_logs, home_model
+        if game_day != prev_day:
+            nhl_api._remaining(deadline)
+            if prev_day is not None and prev_day >= primary["start"]:
+                snapshots[prev_day] = dict(primary["ratings"])
+            # Checkpoint = every model's state before this day's games
+            last_cp = date.fromisoformat(checkpoints[-1]["date"]) if checkpoints else None
+            if game_day >= checkpoint_from and all(game_day >= t["start"] for t in tracks.values()) \
+                    and (last_cp is None or (game_day - last_cp).days >= CHECKPOINT_EVERY_DAYS):
+                checkpoints.append(_checkpoint(game_day, tracks))
+                del checkpoints[:-CHECKPOINT_KEEP]
+        prev_day = game_day
+
+        # Decoded once, applied to every model that has not yet seen this day
+        for t in tracks.values():
+            if game_day >= t["start"]:
+                _apply_final(t, home_id, away_id, home_goals, away_goals, kind, game_day, log_start)
+
+    # Last deadline check: the rating history is only touched past this point
+    nhl_api._remaining(deadline)
+    if truncate_from is not None:
+        RatingHistory(RATING_HISTORY_DIR, season, season_start).truncate(truncate_from)
+    if primary["start"] <= target:
+        snapshots[target] = dict(primary["ratings"])
+        with RatingHistory(RATING_HISTORY_DIR, season, season_start) as history:
+            history.write_days(snapshots)
+
+    # Only the lookback window is ever re-checked
+    for gid in [k for k, v in seen.items() if v[0] < keep_from.isoformat()]:
+        del seen[gid]
+
+    for t in tracks.values():
+        t["src"]["ratings"] = {str(k): float(v) for k, v in t["ratings"].items()}
+        t["src"]["last_built"] = target.isoformat()
+        t["src"]["home_model"] = t["home_model"]
+        # Last 10 per team is all compute_form_and_rest reads; keeps incremental runs' form complete
+        t["src"]["team_logs"] = encode_team_logs(t["logs"])
+    if save:
+        save_state(state)
+
+    return primary["ratings"], f"updated {primary['updates']} finals{replay_note}", primary["logs"], primary["home_model"], _model_views(models, tracks)
 
 def weighted_avg(vals: list[float], weights: list[float]) -> float:
     if not vals:
@@ -274,26 +584,137 @@ def form_points(form: dict | None, is_home: bool) -> float:
     pts = (res * RESIDUAL_TO_POINTS) + (gd * GD_TO_POINTS)
     return clamp(pts, -FORM_POINTS_MAX, FORM_POINTS_MAX)
 
-def why_breakdown_homeprob(r_home: float, r_away: float, form_h: float, form_a: float, fat_h: float, fat_a: float, h_team: float):
+def why_breakdown_homeprob(r_home: float, r_away: float, form_h: float, form_a: float, fat_h: float, fat_a: float, h_team: float, gk_h: float = 0.0, gk_a: float = 0.0):
     cfg0 = EloConfig(base_rating=CFG.base_rating, home_ice_adv=0.0, scale=CFG.scale)
     cfgH = EloConfig(base_rating=CFG.base_rating, home_ice_adv=h_team, scale=CFG.scale)
 
     p_base = prob_shrink(expected_home(r_home, r_away, cfg0))
     p_homeice = prob_shrink(expected_home(r_home, r_away, cfgH))
     p_form = prob_shrink(expected_home(r_home + form_h, r_away + form_a, cfgH))
-    p_final = prob_shrink(expected_home(r_home + form_h + fat_h, r_away + form_a + fat_a, cfgH))
+    p_rest = prob_shrink(expected_home(r_home + form_h + fat_h, r_away + form_a + fat_a, cfgH))
+    p_final = prob_shrink(expected_home(r_home + form_h + fat_h + gk_h, r_away + form_a + fat_a + gk_a, cfgH))
 
     return {
         "base": p_base,
         "home_ice_pp": (p_homeice - p_base) * 100.0,
         "form_pp": (p_form - p_homeice) * 100.0,
-        "fatigue_pp": (p_final - p_form) * 100.0,
+        "fatigue_pp": (p_rest - p_form) * 100.0,
+        "goalie_pp": (p_final - p_rest) * 100.0,
         "final": p_final,
     }
 
-def top3_for_date(day: date, ratings: dict[int,float], form: dict[int,dict], home_model: dict) -> list[dict]:
-    games = nhl_api.get_schedule_for_date(day)
-    picks: list[dict] = []
+def goalie_whatif_grids(rows: list[dict]) -> list[list[list[float]]]:
+    """Score every (home starter, away starter) pair for a slate in one NumPy pass.
+
+    Each row carries the game's goalie-free rating totals, its home advantage and the
+    candidate goalie point lists. Pairs only shift the rating difference, so all games
+    x pairings are one (games, home cands, away cands) difference array fed through
+    uncertainty.home_prob (expected_home + prob_shrink); padding cells are sliced off.
+    """
+    if not rows:
+        return []
+    width_h = max(len(r["home_pts"]) for r in rows)
+    width_a = max(len(r["away_pts"]) for r in rows)
+    home_pts = np.array([r["home_pts"] + [0.0] * (width_h - len(r["home_pts"])) for r in rows])
+    away_pts = np.array([r["away_pts"] + [0.0] * (width_a - len(r["away_pts"])) for r in rows])
+    base = np.array([r["home_total"] + r["h_team"] - r["away_total"] for r in rows])
+    diff = base[:, None, None] + home_pts[:, :, None] - away_pts[:, None, :]
+    p = np.round(uncertainty.home_prob(diff, CFG.scale, PROB_SHRINK), 4).tolist()
+    return [[line[:len(r["away_pts"])] for line in grid[:len(r["home_pts"])]] for r, grid in zip(rows, p)]
+
+def slate_intervals(schedules: dict[str, list[dict]], ratings: dict[int, float], logs: dict[int, list[dict]],
+                    home_model: dict, form: dict[int, dict], goalie_profiles: dict) -> dict[str, list[float]]:
+    """Bootstrap home-win intervals for every scheduled game in one batched NumPy pass.
+
+    Returns {gamePk: [lo, hi]} at BOOTSTRAP_LEVEL for the primary model's home probability.
+    Ratings and rest are held fixed; form, home advantage and goalie SV% are resampled.
+    """
+    games = []
+    for d, gs in schedules.items():
+        for g in gs or []:
+            basic = nhl_api.parse_game_basic(g)
+            if basic["home_team_id"] is not None and basic["away_team_id"] is not None:
+                games.append(basic)
+    if not games:
+        return {}
+
+    width = len(RECENCY_WEIGHTS)
+    sides = [(b["home_team_id"], b.get("home_team_abbrev"), True) for b in games] + \
+            [(b["away_team_id"], b.get("away_team_abbrev"), False) for b in games]
+    res = np.zeros((len(sides), width))
+    gd = np.zeros((len(sides), width))
+    n = np.zeros(len(sides), dtype=np.int64)
+    fixed = np.zeros(len(sides))  # rating + fatigue
+    sv = np.zeros(len(sides))
+    shots = np.zeros(len(sides))
+    gk_shrink = np.zeros(len(sides))
+    for i, (tid, abbrev, is_home) in enumerate(sides):
+        last10 = sorted(logs.get(tid, []), key=lambda x: x["date"])[-10:]
+        split = [e for e in last10 if e["is_home"] == is_home]
+        use = split if len(split) >= 5 else last10
+        n[i] = len(use)
+        res[i, :n[i]] = [e["residual"] for e in use]
+        gd[i, :n[i]] = [e["gd"] for e in use]
+        f = form.get(tid)
+        fixed[i] = float(ratings.get(tid, CFG.base_rating)) + (fatigue_points(f["rest_days"]) if f else 0.0)
+        gk = team_goalie_candidates(abbrev, goalie_profiles, limit=1) if USE_GOALIE_ADJ else []
+        if gk:
+            sv[i] = gk[0].save_pctg
+            shots[i] = gk[0].games_played * GOALIE_SHOTS_PER_GAME
+            gk_shrink[i] = min(1.0, max(0.0, gk[0].games_played / 15.0))
+
+    hm = [home_model.get(str(b["home_team_id"]), {}) for b in games]
+    h_n = np.array([int(s.get("n", 0)) for s in hm])
+    h_mean = np.array([float(s.get("res_sum", 0.0)) / k if k else 0.0 for s, k in zip(hm, h_n)])
+    h_var = np.array([_home_res_var(s) for s in hm])
+
+    rng = np.random.default_rng(BOOTSTRAP_SEED)
+    B = BOOTSTRAP_SAMPLES
+    form_pts = uncertainty.resampled_form_points(res, gd, n, RECENCY_WEIGHTS, RESIDUAL_TO_POINTS, GD_TO_POINTS, FORM_POINTS_MAX, B, rng)
+    gk_pts = uncertainty.resampled_goalie_points(sv, shots, gk_shrink, LEAGUE_AVG_SV, PTS_PER_010_SV, MAX_ADJ_PTS, B, rng)
+    h_adv = uncertainty.resampled_home_adv(h_mean, np.sqrt(np.maximum(h_var, 0.0)), h_n, H_HOME_BASE, H_HOME_LEARN_RATE,
+                                           H_HOME_K, H_HOME_MIN, H_HOME_MAX, B, rng)
+
+    side_total = fixed[None, :] + form_pts + gk_pts
+    G = len(games)
+    diff = side_total[:, :G] + h_adv - side_total[:, G:]
+    band = uncertainty.percentile_band(uncertainty.home_prob(diff, CFG.scale, PROB_SHRINK), BOOTSTRAP_LEVEL)
+    return {str(b["gamePk"]): [float(lo), float(hi)] for b, lo, hi in zip(games, band["lo"], band["hi"])}
+
+def series_game_prob(home_id: int, away_id: int, ratings: dict[int, float], home_model: dict) -> float:
+    """Single playoff game, home side: ratings + team home advantage only (form/rest/goalies
+    are unknown that far ahead)."""
+    h_team = get_team_home_adv(home_id, home_model)
+    cfg_game = EloConfig(base_rating=CFG.base_rating, home_ice_adv=h_team, scale=CFG.scale)
+    return prob_shrink(expected_home(float(ratings.get(home_id, CFG.base_rating)), float(ratings.get(away_id, CFG.base_rating)), cfg_game))
+
+def export_series_table(ratings: dict[int, float], home_model: dict, teams: dict) -> dict:
+    """Best-of-7 odds for every pairing of rated teams (row team holds home ice)."""
+    table = pairing_table(sorted(ratings), lambda h, a: series_game_prob(h, a, ratings, home_model))
+    table["abbrevs"] = [(teams.get(str(t)) or {}).get("abbrev") for t in table["teams"]]
+    table["generated_at"] = datetime.now(tzutc()).isoformat().replace("+00:00", "Z")
+    table["pattern"] = "2-2-1-1-1"
+    return table
+
+def model_home_prob(model: ModelConfig, track: dict, home_id: int, away_id: int, gk_home: float, gk_away: float) -> float:
+    """Home win probability under one ensemble model (its own ratings, home model and form)."""
+    ratings, form = track["ratings"], track["form"]
+    fh = form.get(home_id)
+    fa = form.get(away_id)
+    home = float(ratings.get(home_id, CFG.base_rating)) + form_points(fh, is_home=True) + (fatigue_points(fh["rest_days"]) if fh else 0.0)
+    away = float(ratings.get(away_id, CFG.base_rating)) + form_points(fa, is_home=False) + (fatigue_points(fa["rest_days"]) if fa else 0.0)
+    if model.goalie_adj:
+        home += gk_home
+        away += gk_away
+    h_team = _model_home_adv(model, home_id, track["home_model"])
+    cfg_game = EloConfig(base_rating=CFG.base_rating, home_ice_adv=h_team, scale=CFG.scale)
+    return prob_shrink(expected_home(home, away, cfg_game), model.prob_shrink)
+
+def top3_for_date(day: date, ratings: dict[int,float], form: dict[int,dict], home_model: dict, cal_table: list[float] | None = None, goalie_profiles: dict | None = None, tracks: dict | None = None, model_tables: dict | None = None, games: list[dict] | None = None) -> list[dict]:
+    if games is None:
+        games = nhl_api.get_schedule_for_date(day)
+    goalie_profiles = goalie_profiles or {}
+    rows: list[dict] = []
     for g in games:
         basic = nhl_api.parse_game_basic(g)
         home_id = basic["home_team_id"]
@@ -305,7 +726,6 @@ def top3_for_date(day: date, ratings: dict[int,float], form: dict[int,dict], hom
         away_rt = float(ratings.get(away_id, CFG.base_rating))
 
         h_team = get_team_home_adv(home_id, home_model)
-        cfg_game = EloConfig(base_rating=CFG.base_rating, home_ice_adv=h_team, scale=CFG.scale)
 
         fh = form.get(home_id)
         fa = form.get(away_id)
@@ -316,27 +736,68 @@ def top3_for_date(day: date, ratings: dict[int,float], form: dict[int,dict], hom
         fat_home = fatigue_points(fh["rest_days"]) if fh else 0.0
         fat_away = fatigue_points(fa["rest_days"]) if fa else 0.0
 
-        p_home = prob_shrink(expected_home(home_rt + form_home + fat_home, away_rt + form_away + fat_away, cfg_game))
-        p_away = 1.0 - p_home
+        # Plausible starters, probable first; no goalie data -> a single neutral entry
+        home_gk = team_goalie_candidates(basic.get("home_team_abbrev"), goalie_profiles, GOALIE_WHATIF_CANDIDATES) if USE_GOALIE_ADJ else []
+        away_gk = team_goalie_candidates(basic.get("away_team_abbrev"), goalie_profiles, GOALIE_WHATIF_CANDIDATES) if USE_GOALIE_ADJ else []
+
+        rows.append({
+            "basic": basic,
+            "home_rt": home_rt,
+            "away_rt": away_rt,
+            "h_team": h_team,
+            "form_home": form_home,
+            "form_away": form_away,
+            "fat_home": fat_home,
+            "fat_away": fat_away,
+            "home_total": home_rt + form_home + fat_home,
+            "away_total": away_rt + form_away + fat_away,
+            "home_gk": home_gk,
+            "away_gk": away_gk,
+            "home_pts": [goalie_adjustment_points(gp) for gp in home_gk] or [0.0],
+            "away_pts": [goalie_adjustment_points(gp) for gp in away_gk] or [0.0],
+        })
+
+    grids = goalie_whatif_grids(rows)
 
-        why_home = why_breakdown_homeprob(home_rt, away_rt, form_home, form_away, fat_home, fat_away, h_team)
+    picks: list[dict] = []
+    for row, grid in zip(rows, grids):
+        basic = row["basic"]
+        home_rt, away_rt, h_team = row["home_rt"], row["away_rt"], row["h_team"]
+        form_home, form_away = row["form_home"], row["form_away"]
+        fat_home, fat_away = row["fat_home"], row["fat_away"]
+        gk_home, gk_away = row["home_pts"][0], row["away_pts"][0]
+
+        why_home = why_breakdown_homeprob(home_rt, away_rt, form_home, form_away, fat_home, fat_away, h_team, gk_home, gk_away)
+        p_home = why_home["final"]
+        p_away = 1.0 - p_home
 
         if p_home >= p_away:
             pick_name = basic["home_team_name"]
+            pick_team_id = basic["home_team_id"]
             win_prob = p_home
             why_pick = why_home
-            factors = f"HomeAdv {h_team:.0f} + wOppAdj form {form_home:+.0f}/{form_away:+.0f} + Rest {fat_home:+.0f}/{fat_away:+.0f}"
+            factors = f"HomeAdv {h_team:.0f} + wOppAdj form {form_home:+.0f}/{form_away:+.0f} + Rest {fat_home:+.0f}/{fat_away:+.0f} + G {gk_home:+.0f}/{gk_away:+.0f}"
         else:
             pick_name = basic["away_team_name"]
+            pick_team_id = basic["away_team_id"]
             win_prob = p_away
             why_pick = {
                 "base": 1.0 - why_home["base"],
                 "home_ice_pp": -why_home["home_ice_pp"],
                 "form_pp": -why_home["form_pp"],
                 "fatigue_pp": -why_home["fatigue_pp"],
+                "goalie_pp": -why_home["goalie_pp"],
                 "final": 1.0 - why_home["final"],
             }
-            factors = f"Road pick vs HomeAdv {h_team:.0f} + wOppAdj form {form_away:+.0f}/{form_home:+.0f} + Rest {fat_away:+.0f}/{fat_home:+.0f}"
+            factors = f"Road pick vs HomeAdv {h_team:.0f} + wOppAdj form {form_away:+.0f}/{form_home:+.0f} + Rest {fat_away:+.0f}/{fat_home:+.0f} + G {gk_away:+.0f}/{gk_home:+.0f}"
+
+        models = {}
+        for name, t in (tracks or {}).items():
+            ph = model_home_prob(t["model"], t, basic["home_team_id"], basic["away_team_id"], gk_home, gk_away)
+            pm = ph if pick_team_id == basic["home_team_id"] else 1.0 - ph
+            table = (model_tables or {}).get(name)
+            models[name] = {"p": round(pm, 4), "cal": round(lut_lookup(pm, table), 4), "w": t["model"].weight}
+        w_total = sum(m["w"] for m in models.values())
 
         picks.append({
             "gamePk": basic["gamePk"],
@@ -345,14 +806,26 @@ def top3_for_date(day: date, ratings: dict[int,float], form: dict[int,dict], hom
             "home_elo": home_rt,
             "away_elo": away_rt,
             "pick_name": pick_name,
+            "pick_team_id": pick_team_id,
             "win_prob": win_prob,
+            "win_prob_cal": lut_lookup(win_prob, cal_table),
+            "win_prob_blend": (sum(m["p"] * m["w"] for m in models.values()) / w_total) if w_total else win_prob,
+            "models": {name: {"p": m["p"], "cal": m["cal"]} for name, m in models.items()},
             "factors": factors,
             "why": why_pick,
             "form_home": f"{form_home:+.0f}",
             "form_away": f"{form_away:+.0f}",
             "fat_home": f"{fat_home:+.0f}",
             "fat_away": f"{fat_away:+.0f}",
+            "goalie_home": f"{gk_home:+.0f}",
+            "goalie_away": f"{gk_away:+.0f}",
             "home_adv": float(h_team),
+            # p_home[i][j]: home win prob with home candidate i vs away candidate j (index 0 = probable)
+            "goalie_whatif": {
+                "home": [[gp.player_id, round(pts, 1)] for gp, pts in zip(row["home_gk"], row["home_pts"])],
+                "away": [[gp.player_id, round(pts, 1)] for gp, pts in zip(row["away_gk"], row["away_pts"])],
+                "p_home": grid,
+            },
         })
 
     picks.sort(key=lambda x: x["win_prob"], reverse=True)
@@ -484,14 +957,61 @@ def goalie_points_from_recent(goalie, recent_sv: float|None, recent_starts: int)
     pts = max(-MAX_ADJ_PTS, min(MAX_ADJ_PTS, pts))
     return float(pts)
 
-FALLBACK_TO_PREVIOUS_PICKS = True
+FALLBACK_TO_PREVIOUS_PICKS = True  # per picks:<date> stage; whole run only if nothing can be scored
 
+# Build DAG (see build_stages): per-stage timeouts in seconds
+PIPELINE_WORKERS = 6
+STAGE_TIMEOUTS = {"goalies": 60.0, "calibration": 180.0, "ratings": 900.0, "schedule": 90.0, "picks": 60.0, "intervals": 60.0}
+
+BUNDLE_TEAM_FIELDS = ["abbrev", "name", "elo", "home_adv", "form_home", "form_away", "fatigue", "goalie_pts", "goalie_id"]
+
+def export_model_bundle(ratings: dict[int, float], form: dict[int, dict], home_model: dict, goalie_profiles: dict,
+                        teams: dict, schedules: dict[str, list[dict]]) -> dict:
+    """Compact per-team inputs + slates so docs/app.js can score any game itself.
+
+    Every term is pre-reduced to rating points; the browser only needs
+    expected_home and prob_shrink to reproduce `win_prob` for the primary model.
+    """
+    slates: dict[str, list] = {}
+    names = {int(k): dict(v) for k, v in teams.items()}
+    for d, games in schedules.items():
+        rows = []
+        for g in games:
+            basic = nhl_api.parse_game_basic(g)
+            if basic["home_team_id"] is None or basic["away_team_id"] is None:
+                continue
+            rows.append([basic["gamePk"], basic["home_team_id"], basic["away_team_id"]])
+            for side in ("home", "away"):
+                names.setdefault(basic[f"{side}_team_id"], {"abbrev": basic.get(f"{side}_team_abbrev"), "name": basic.get(f"{side}_team_name")})
+        slates[d] = rows
+
+    team_rows = {}
+    for tid in sorted(set(ratings) | set(names)):
+        info = names.get(tid) or {}
+        f = form.get(tid)
+        gk = team_goalie_candidates(info.get("abbrev"), goalie_profiles, limit=1) if USE_GOALIE_ADJ else []
+        team_rows[str(tid)] = [
+            info.get("abbrev"),
+            info.get("name"),
+            round(float(ratings.get(tid, CFG.base_rating)), 1),
+            round(get_team_home_adv(tid, home_model), 1),
+            round(form_points(f, is_home=True), 1),
+            round(form_points(f, is_home=False), 1),
+            fatigue_points(f["rest_days"]) if f else 0.0,
+            round(goalie_adjustment_points(gk[0]), 1) if gk else 0.0,
+            gk[0].player_id if gk else None,
+        ]
+
+    return {
+        "generated_at": datetime.now(tzutc()).isoformat().replace("+00:00", "Z"),
+        "scale": CFG.scale,
+        "prob_shrink": PROB_SHRINK,
+        "fields": BUNDLE_TEAM_FIELDS,
+        "teams": team_rows,
+        "slates": slates,
+    }
 
 
-def _cal_bin_key(p: float) -> float:
-    p2 = max(CAL_MIN, min(CAL_MAX, float(p)))
-    k = (int(p2 / CAL_BIN_SIZE) * CAL_BIN_SIZE)
-    return round(k, 2)
 
 def load_pick_history() -> list[dict]:
     if PICK_HISTORY_PATH.exists():
@@ -505,38 +1025,8 @@ def save_pick_history(hist: list[dict]) -> None:
     PICK_HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
     PICK_HISTORY_PATH.write_text(json.dumps(hist[-CAL_MAX_HISTORY:], indent=2), encoding="utf-8")
 
-def load_calibration() -> dict:
-    if CALIBRATION_PATH.exists():
-        try:
-            return json.loads(CALIBRATION_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            return {"bins": {}}
-    return {"bins": {}}
-
-def save_calibration(cal: dict) -> None:
-    CALIBRATION_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CALIBRATION_PATH.write_text(json.dumps(cal, indent=2), encoding="utf-8")
-
-def calibrate_prob(p: float, cal: dict) -> float:
-    k = str(_cal_bin_key(p))
-    b = (cal.get("bins") or {}).get(k)
-    if not b:
-        return float(p)
-    n = b.get("n", 0)
-    w = b.get("w", 0)
-    if n <= 0:
-        return float(p)
-    return float((w + 1) / (n + 2))  # Laplace smoothing
-
-def _update_calibration_with_result(cal: dict, p: float, outcome: int) -> None:
-    k = str(_cal_bin_key(p))
-    cal.setdefault("bins", {})
-    b = cal["bins"].setdefault(k, {"n": 0, "w": 0})
-    b["n"] += 1
-    b["w"] += int(outcome)
-
-def resolve_history_and_update_calibration(hist: list[dict], cal: dict) -> tuple[list[dict], dict]:
-    """Resolve any unscored picks using score feed and update calibration bins."""
+def resolve_history(hist: list[dict]) -> list[dict]:
+    """Resolve any unscored picks using the score feed."""
     by_date: dict[str, list[dict]] = {}
     for rec in hist:
         if rec.get("resolved") is True:
@@ -577,65 +1067,234 @@ def resolve_history_and_update_calibration(hist: list[dict], cal: dict) -> tuple
             if not g:
                 continue
             basic = nhl_api.parse_game_basic(g)
-            if basic.get("status") != "final":
+            if not nhl_api.is_final(g):
                 continue
 
-            home_goals = basic.get("home_goals")
-            away_goals = basic.get("away_goals")
-            if home_goals is None or away_goals is None:
+            score = nhl_api.get_final_score(g)
+            if not score:
                 continue
+            home_goals, away_goals = score
             winner_team_id = basic["home_team_id"] if home_goals > away_goals else basic["away_team_id"]
             outcome = 1 if int(rec.get("pick_team_id", -1)) == int(winner_team_id) else 0
 
-            p_full = float(rec.get("p_full_raw", rec.get("p_full", 0.5)))
-            p_reg = float(rec.get("p_reg_raw", rec.get("p_reg", 0.5)))
-            _update_calibration_with_result(cal, p_full, outcome)
-            _update_calibration_with_result(cal, p_reg, outcome)
-
             rec["resolved"] = True
             rec["outcome"] = outcome
             rec["resolved_at"] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
 
-    return hist, cal
+    return hist
 
-def main():
-    session = requests.Session()
+def refit_calibration_table(hist: list[dict]) -> dict:
+    """Refit the isotonic lookup tables from every resolved pick.
 
-    # --- Goalie stats (season-to-date) ---
-    goalie_profiles = {}
-    try:
-        goalie_payload = nhl_api.get_goalie_stats_current(session=session)
-        goalie_profiles = parse_goalie_leaders(goalie_payload)
-    except Exception:
-        goalie_profiles = {}
+    `isotonic` is the published (primary) probability; `models` holds one table per
+    ensemble model, fitted on that model's own raw probability for the same pick.
+    The tables are rebuilt every run and never persisted; pick history is the source.
+    """
+    points = []
+    per_model: dict[str, list] = {m.name: [] for m in ENSEMBLE_MODELS}
+    for rec in hist:
+        if rec.get("resolved") is not True or rec.get("outcome") is None:
+            continue
+        outcome = int(rec["outcome"])
+        p = rec.get("p_full_raw", rec.get("p_full"))
+        if p is not None:
+            points.append((float(p), outcome))
+        for name, pm in (rec.get("p_models") or {}).items():
+            per_model.setdefault(name, []).append((float(pm), outcome))
+    return {
+        "isotonic": build_table(points),
+        "models": {name: build_table(pts) for name, pts in per_model.items()},
+    }
+
+def record_picks_in_history(hist: list[dict], by_date: dict) -> None:
+    """Add (or refresh) an unresolved history record for every published pick.
+
+    The same game is published on up to 8 consecutive runs; the latest pregame
+    prediction replaces the earlier one instead of being counted again.
+    """
+    open_by_game = {rec.get("game_id"): rec for rec in hist if rec.get("resolved") is not True}
+    now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    for d, block in by_date.items():
+        for p in block.get("picks", []):
+            rec = open_by_game.get(p.get("gamePk"))
+            if rec is None:
+                rec = {"game_id": p.get("gamePk"), "resolved": False, "created_at": now}
+                hist.append(rec)
+                open_by_game[rec["game_id"]] = rec
+            rec.update({
+                "game_date": d,
+                "pick_team_id": p.get("pick_team_id"),
+                "p_full": p.get("win_prob_cal"),
+                "p_full_raw": p.get("win_prob"),
+                "p_models": {name: m["p"] for name, m in (p.get("models") or {}).items()},
+                "updated_at": now,
+            })
+
+def update_track_record(hist: list[dict]) -> int:
+    """Fold newly resolved picks into the public track-record summary; returns how many.
+
+    If the summary is missing (or from an older rollup version), every resolved pick
+    still in history is rolled up again.
+    """
+    saved = load_json(TRACK_RECORD_PATH, None)
+    if saved is not None and saved.get("version") != TRACK_RECORD_VERSION:
+        saved = None
+    if saved is None:
+        for rec in hist:
+            rec.pop("rolled_up", None)
+    record = load_record(saved)
+    added = roll_up(record, hist)
+    if added or saved is None:
+        TRACK_RECORD_PATH.parent.mkdir(parents=True, exist_ok=True)
+        TRACK_RECORD_PATH.write_text(json.dumps(publish(record), separators=(",", ":")), encoding="utf-8")
+    return added
+
+def stored_ratings(target: date, state: dict, note: str, models: list[ModelConfig] | None = None):
+    """Last persisted ratings for `target`'s season, in rebuild_ratings_to's return shape (no fetch)."""
+    sstate = state["seasons"].get(season_from_date(target))
+    if not sstate or not sstate.get("last_built"):
+        raise RuntimeError("no stored ratings for this season")
+    models = _with_primary(models)
+    keys = {_track_key(m, models): m.learned_home for m in models}
+    tracks = {key: _load_track(key, learned_home, sstate) for key, learned_home in keys.items()}
+    primary = tracks[PRIMARY_MODEL]
+    return primary["ratings"], note, primary["logs"], primary["home_model"], _model_views(models, tracks)
+
+def build_stages(today: date, dates: list[date], state: dict, session, previous: dict, rebuild_state: dict) -> list[Stage]:
+    """Declare the daily build as a DAG; each stage's output is named after the stage.
+
+    goalies, calibration, ratings and every schedule:<date> fetch are independent and run
+    concurrently; form waits on ratings, and picks:<date> waits on everything it scores with.
+    The ratings stage rebuilds into `rebuild_state` (a private copy of `state`) and never
+    saves; main() adopts it only if the stage finished in time.
+    """
+    ratings_day = today - timedelta(days=1)
 
+    def goalies():
+        profiles = parse_goalie_leaders(nhl_api.get_goalie_stats_current(session=session))
+        if not profiles:
+            raise RuntimeError("no goalie rows")
+        return profiles
+
+    def calibration():
+        hist = resolve_history(load_pick_history())
+        return hist, refit_calibration_table(hist)
+
+    def calibration_fallback(err):
+        hist = load_pick_history()
+        return hist, refit_calibration_table(hist)
+
+    def form(rebuilt):
+        *_, tracks = rebuilt
+        by_key: dict[str, dict] = {}
+        for t in tracks.values():
+            if t["key"] not in by_key:
+                by_key[t["key"]] = compute_form_and_rest(today, t["logs"])
+            t["form"] = by_key[t["key"]]
+        return tracks[PRIMARY_MODEL]["form"]
+
+    def picks_for(d: date):
+        def run(rebuilt, form, goalie_profiles, calibrated, games):
+            if games is None:
+                raise RuntimeError("schedule unavailable")
+            ratings, build_note, _, home_model, tracks = rebuilt
+            _, cal = calibrated
+            cal_table = (cal.get("isotonic") or {}).get("table")
+            model_tables = {name: t.get("table") for name, t in (cal.get("models") or {}).items()}
+            picks = top3_for_date(d, ratings, form, home_model, cal_table, goalie_profiles, tracks, model_tables, games)
+            return {"picks": picks, "build_note": build_note}
+
+        def keep_previous(err, *_):
+            block = (previous.get("by_date") or {}).get(d.isoformat())
+            if FALLBACK_TO_PREVIOUS_PICKS and block:
+                print(f"WARN: picks for {d} failed ({err}); keeping previous picks")
+                return {**block, "build_note": f"previous picks kept ({err})"}
+            return {"picks": [], "build_note": f"unavailable ({err})"}
+        return run, keep_previous
+
+    stages = [
+        Stage("goalies", goalies, timeout=STAGE_TIMEOUTS["goalies"],
+              fallback=lambda err: load_goalie_profiles(state)),
+        Stage("calibration", calibration, timeout=STAGE_TIMEOUTS["calibration"], fallback=calibration_fallback),
+        Stage("ratings", lambda: rebuild_ratings_to(ratings_day, rebuild_state, save=False,
+                                                    deadline=time.monotonic() + STAGE_TIMEOUTS["ratings"]),
+              timeout=STAGE_TIMEOUTS["ratings"],
+              fallback=lambda err: stored_ratings(ratings_day, state, f"stale ratings (rebuild failed: {err})")),
+        Stage("form", form, inputs=("ratings",)),
+    ]
+    for d in dates:
+        key = d.isoformat()
+        run, keep_previous = picks_for(d)
+        stages.append(Stage(f"schedule:{key}", lambda d=d: nhl_api.get_schedule_for_date(d),
+                            timeout=STAGE_TIMEOUTS["schedule"], fallback=lambda err: None))
+        stages.append(Stage(f"picks:{key}", run, inputs=("ratings", "form", "goalies", "calibration", f"schedule:{key}"),
+                            timeout=STAGE_TIMEOUTS["picks"], fallback=keep_previous))
+
+    def intervals(rebuilt, form, goalie_profiles, *schedules):
+        ratings, _, logs, home_model, _ = rebuilt
+        by_day = {d.isoformat(): games for d, games in zip(dates, schedules)}
+        return slate_intervals(by_day, ratings, logs, home_model, form, goalie_profiles)
+
+    if today.month in SERIES_EXPORT_MONTHS:
+        stages.append(Stage("series", lambda rebuilt: export_series_table(rebuilt[0], rebuilt[3], rebuild_state.get("teams") or {}),
+                            inputs=("ratings",), fallback=lambda err, *_: None))
+
+    stages.append(Stage("intervals", intervals, inputs=("ratings", "form", "goalies", *[f"schedule:{d.isoformat()}" for d in dates]),
+                        timeout=STAGE_TIMEOUTS["intervals"], fallback=lambda err, *_: {}))
+    return stages
+
+def main():
+    session = requests.Session()
 
     today = date.today()
     dates = [today + timedelta(days=i) for i in range(0, 8)]
 
     ratings_day = today - timedelta(days=1)
     state = load_state()
+    previous = load_json(PICKS_PATH, {}) if PICKS_PATH.exists() else {}
     box_cache = load_json(BOX_CACHE_PATH, {})
-    cal = load_calibration()
-    hist = load_pick_history()
-    hist, cal = resolve_history_and_update_calibration(hist, cal)
-    # reset per-run fetch counter
-    box_cache["_new_fetches"] = 0
+    rebuild_state = copy.deepcopy(state)
 
     try:
-        ratings, build_note, logs, home_model = rebuild_ratings_to(ratings_day, state)
-    except RuntimeError as e:
+        values, report = run_stages(build_stages(today, dates, state, session, previous, rebuild_state),
+                                    max_workers=PIPELINE_WORKERS)
+    except StageError as e:
         if FALLBACK_TO_PREVIOUS_PICKS and PICKS_PATH.exists():
-            print(f"WARN: rebuild failed ({e}); keeping previous picks.json")
+            print(f"WARN: build failed ({e}); keeping previous picks.json")
             return
         raise
 
-    form = compute_form_and_rest(today, logs)
+    for name, r in report.items():
+        if r["status"] != "ok":
+            print(f"WARN: stage {name} {r['status']}: {r.get('error')}")
+
+    # A timed-out rebuild may still be running on its copy; only a finished one is adopted
+    if report["ratings"]["status"] == "ok":
+        state["seasons"] = rebuild_state["seasons"]
+        state["teams"] = rebuild_state.get("teams") or {}
+
+    # --- Goalie stats (season-to-date); last good fetch is kept in state ---
+    goalie_profiles = values["goalies"]
+    if report["goalies"]["status"] == "ok":
+        state["goalies"] = {
+            "fetched_at": datetime.now(tzutc()).isoformat().replace("+00:00", "Z"),
+            "profiles": [asdict(gp) for gp in goalie_profiles.values()],
+        }
+    save_state(state)
 
-    by_date = {}
-    for d in dates:
-        picks = top3_for_date(d, ratings, form, home_model)
-        by_date[d.isoformat()] = {"picks": picks, "build_note": build_note}
+    ratings, build_note, logs, home_model, tracks = values["ratings"]
+    form = values["form"]
+    hist, cal = values["calibration"]
+    schedules = {d.isoformat(): values[f"schedule:{d.isoformat()}"] or [] for d in dates}
+    by_date = {d.isoformat(): values[f"picks:{d.isoformat()}"] for d in dates}
+    for d, block in by_date.items():
+        if report[f"picks:{d}"]["status"] != "ok":
+            continue
+        for p in block["picks"]:
+            band = values["intervals"].get(str(p["gamePk"]))
+            if band:
+                lo, hi = band if p["pick_name"] == p["home_name"] else (1.0 - band[1], 1.0 - band[0])
+                p["win_prob_ci"] = [round(lo, 4), round(hi, 4)]
 
     payload = {
         "generated_at": datetime.now(tzutc()).isoformat().replace("+00:00", "Z"),
@@ -647,29 +1306,33 @@ def main():
             "form": "opponent-adjusted residuals (last 10) with recency weights; home/away splits when n>=5",
             "home_adv": "team-specific learned home advantage from season home residuals (smoothed + bounded)",
             "home_adv_bounds": [H_HOME_MIN, H_HOME_MAX],
+            "goalie": "probable starter (most GP) season SV% vs league avg; goalie_whatif.p_home scores every candidate pairing",
+            "calibration": "win_prob_cal = isotonic (PAVA) fit on resolved picks, compiled to a lookup table; identity until enough history",
+            "calibration_samples": (cal.get("isotonic") or {}).get("n", 0),
+            "calibration_brier": {k: (cal.get("isotonic") or {}).get(f"brier_{k}") for k in ("raw", "cal")},
+            "ensemble": {m.name: {"prob_shrink": m.prob_shrink, "learned_home": m.learned_home, "goalie_adj": m.goalie_adj, "weight": m.weight} for m in ENSEMBLE_MODELS},
+            "primary_model": PRIMARY_MODEL,
+            "win_prob_ci": f"{BOOTSTRAP_LEVEL:.0%} bootstrap interval ({BOOTSTRAP_SAMPLES} resamples of last-10 form logs, home-adv residuals, goalie SV%)",
+            "stages": report,
         }
     }
 
     PICKS_PATH.parent.mkdir(parents=True, exist_ok=True)
     PICKS_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
-    # Append today's picks to history for future calibration resolution
-    for p in payload.get("picks", []):
-        hist.append({
-            "game_date": payload.get("date"),
-            "game_id": p.get("game_id"),
-            "pick_team_id": p.get("pick_team_id"),
-            "p_full": p.get("win_prob_full"),
-            "p_reg": p.get("win_prob_reg"),
-            "p_full_raw": p.get("win_prob_full_raw"),
-            "p_reg_raw": p.get("win_prob_reg_raw"),
-            "resolved": False,
-            "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-        })
+    bundle = export_model_bundle(ratings, form, home_model, goalie_profiles, state.get("teams") or {}, schedules)
+    bundle["rating_history"] = f"ratings_{season_from_date(ratings_day)}"
+    MODEL_BUNDLE_PATH.write_text(json.dumps(bundle, separators=(",", ":")), encoding="utf-8")
 
-    save_pick_history(hist)
-    save_calibration(cal)
+    if values.get("series"):
+        SERIES_PATH.write_text(json.dumps(values["series"], separators=(",", ":")), encoding="utf-8")
+
+    # Record published picks for future calibration resolution (skip days that reused old picks)
+    fresh = {d: b for d, b in by_date.items() if report[f"picks:{d}"]["status"] == "ok"}
+    record_picks_in_history(hist, fresh)
+    update_track_record(hist)
 
+    save_pick_history(hist)
 
     # persist boxscore cache (remove ephemeral counter)
     if "_new_fetches" in box_cache:
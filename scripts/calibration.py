@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+LUT_SIZE = 1001          # table resolution: one entry per 0.001 of raw probability
+MIN_SAMPLES = 40         # resolved picks required before the table replaces identity
+PRIOR_WEIGHT = 2.0       # pseudo-observations pinning the curve to (0.5, 0.5)
+
+
+def fit_isotonic(points: Iterable[Tuple[float, int]]) -> List[Tuple[float, float, float]]:
+    """Pool-adjacent-violators fit of outcome on raw probability.
+
+    Every (p, outcome) pair is mirrored as (1-p, 1-outcome) so the fitted curve is
+    symmetric around 0.5 (a home pick at 0.62 is an away pick at 0.38).
+    Returns blocks as (x_mean, y_mean, weight), sorted by x.
+    """
+    obs: List[Tuple[float, float, float]] = [(0.5, 0.5, PRIOR_WEIGHT)]
+    for p, outcome in points:
+        p = min(1.0, max(0.0, float(p)))
+        y = 1.0 if outcome else 0.0
+        obs.append((p, y, 1.0))
+        obs.append((1.0 - p, 1.0 - y, 1.0))
+    obs.sort(key=lambda o: o[0])
+
+    # Each block: [sum_wx, sum_wy, sum_w]
+    blocks: List[List[float]] = []
+    for x, y, w in obs:
+        blocks.append([x * w, y * w, w])
+        while len(blocks) >= 2 and blocks[-2][1] / blocks[-2][2] >= blocks[-1][1] / blocks[-1][2]:
+            wx, wy, ww = blocks.pop()
+            blocks[-1][0] += wx
+            blocks[-1][1] += wy
+            blocks[-1][2] += ww
+    return [(wx / w, wy / w, w) for wx, wy, w in blocks]
+
+
+def compile_lut(blocks: Sequence[Tuple[float, float, float]], size: int = LUT_SIZE) -> List[float]:
+    """Interpolate isotonic blocks onto a dense grid over [0, 1].
+
+    Linear interpolation between block centres keeps the table monotone and avoids
+    the step jumps of the raw PAVA output; the ends are held flat.
+    """
+    if not blocks:
+        return [i / (size - 1) for i in range(size)]
+    xs = [b[0] for b in blocks]
+    ys = [b[1] for b in blocks]
+    lut: List[float] = []
+    j = 0
+    for i in range(size):
+        x = i / (size - 1)
+        while j < len(xs) - 1 and xs[j + 1] < x:
+            j += 1
+        if x <= xs[0]:
+            y = ys[0]
+        elif j >= len(xs) - 1:
+            y = ys[-1]
+        else:
+            x0, x1 = xs[j], xs[j + 1]
+            t = (x - x0) / (x1 - x0) if x1 > x0 else 1.0
+            y = ys[j] + (ys[j + 1] - ys[j]) * t
+        lut.append(round(y, 5))
+    return lut
+
+
+def build_table(points: Iterable[Tuple[float, int]], size: int = LUT_SIZE) -> dict:
+    """Refit the calibration table from resolved (p_raw, outcome) pairs.
+
+    Also reports the Brier score of the raw and calibrated probabilities over the
+    same pairs the table was fitted on (in-sample; the symmetric fit and the prior
+    mean the calibrated score is not guaranteed to be lower).
+    """
+    pts = list(points)
+    if len(pts) < MIN_SAMPLES:
+        return {"n": len(pts), "size": size, "table": None}
+    table = compile_lut(fit_isotonic(pts), size)
+    ps = np.clip(np.array([p for p, _ in pts], dtype=float), 0.0, 1.0)
+    ys = np.array([1.0 if y else 0.0 for _, y in pts])
+    return {
+        "n": len(pts),
+        "size": size,
+        "table": table,
+        "brier_raw": round(float(np.mean((ps - ys) ** 2)), 4),
+        "brier_cal": round(float(np.mean((lut_apply(ps, table) - ys) ** 2)), 4),
+    }
+
+
+def lut_lookup(p: float, lut: Optional[Sequence[float]]) -> float:
+    """O(1) calibrated probability; identity when no table has been fitted."""
+    if not lut:
+        return float(p)
+    p = min(1.0, max(0.0, float(p)))
+    return float(lut[int(p * (len(lut) - 1) + 0.5)])
+
+
+def lut_apply(ps, lut: Optional[Sequence[float]]) -> np.ndarray:
+    """Calibrate a batch of probabilities (build_table's Brier check) in one vectorised lookup.
+
+    Same `floor(p * (size-1) + 0.5)` index arithmetic as lut_lookup, so batch and
+    single-pick results agree exactly.
+    """
+    ps = np.clip(np.asarray(ps, dtype=float), 0.0, 1.0)
+    if not lut:
+        return ps
+    table = np.asarray(lut, dtype=float)
+    return table[np.floor(ps * (len(table) - 1) + 0.5).astype(np.int64)]
@@ -46,11 +46,17 @@ def parse_goalie_leaders(payload: dict) -> Dict[int, GoalieProfile]:
     return out
 
 
-def pick_probable_goalie_id(team_abbrev: str, goalie_profiles: Dict[int, GoalieProfile]) -> Optional[int]:
+def team_goalie_candidates(team_abbrev: str, goalie_profiles: Dict[int, GoalieProfile], limit: int = 3) -> List[GoalieProfile]:
+    """Plausible starters for a team, most likely first (games played, then SV%)."""
     candidates = [g for g in goalie_profiles.values() if g.team_abbrev == team_abbrev]
+    candidates.sort(key=lambda g: (g.games_played, g.save_pctg), reverse=True)
+    return candidates[:limit]
+
+
+def pick_probable_goalie_id(team_abbrev: str, goalie_profiles: Dict[int, GoalieProfile]) -> Optional[int]:
+    candidates = team_goalie_candidates(team_abbrev, goalie_profiles, limit=1)
     if not candidates:
         return None
-    candidates.sort(key=lambda g: (g.games_played, g.save_pctg), reverse=True)
     return candidates[0].player_id
 
 
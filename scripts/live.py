@@ -0,0 +1,291 @@
+"""In-game win probability for tonight's slate from a precomputed state table.
+
+    python scripts/live.py --build-table          # regenerate docs/data/live_table.*
+    python scripts/live.py --interval 10          # poll the score feed, write docs/data/live.json
+    python scripts/live.py --date 2026-01-05 --once
+
+The table is indexed by pregame home win probability x score differential x seconds
+left in regulation (plus a small overtime table). It comes from a Poisson scoring
+model whose home/away goal rates are solved so that a 0-0 game with 60 minutes left
+reproduces the pregame probability. Every poll is one score-feed request for the
+whole slate and one table lookup per game. No empty-net or power-play adjustment.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from dateutil.tz import tzutc
+
+import nhl_api
+from cache import load_json, save_json
+
+LIVE_TABLE_PATH = Path("docs/data/live_table.f32")
+LIVE_META_PATH = Path("docs/data/live_table.json")
+LIVE_PATH = Path("docs/data/live.json")
+
+# Scoring model
+TEAM_GOALS_PER_60 = 3.05   # league-average goals per team per 60 minutes
+OT_RATE_MULT = 1.6         # 3-on-3 overtime scores faster than 5-on-5
+SHOOTOUT_HOME = 0.5        # shootouts treated as coin flips
+MAX_GOALS = 20             # Poisson truncation per side
+
+# Table axes
+REG_SECONDS = 3600
+OT_SECONDS = 300
+P_MIN, P_STEP, N_P = 0.05, 0.02, 46     # pregame home win prob 0.05..0.95
+DIFF_MAX = 6                            # home minus away, clamped to +-6
+T_STEP = 60                             # seconds-left resolution in regulation
+OT_STEP = 30
+
+DEFAULT_INTERVAL = 10
+
+
+def _poisson(lam: float) -> np.ndarray:
+    k = np.arange(1, MAX_GOALS + 1)
+    return math.exp(-lam) * np.concatenate(([1.0], np.cumprod(lam / k)))
+
+
+def ot_win(share: float, seconds_left: float, playoff: bool = False) -> float:
+    """Home win prob from a tie in overtime: sudden death, then (regular season) a shootout."""
+    if playoff:
+        return share
+    q = 1.0 - math.exp(-2.0 * TEAM_GOALS_PER_60 * OT_RATE_MULT * seconds_left / REG_SECONDS)
+    return share * q + (1.0 - q) * SHOOTOUT_HOME
+
+
+def reg_win_by_diff(share: float, seconds_left: float) -> np.ndarray:
+    """Home win prob for each diff in -DIFF_MAX..DIFF_MAX with `seconds_left` of regulation."""
+    lam = 2.0 * TEAM_GOALS_PER_60 * seconds_left / REG_SECONDS
+    # margin[j] = P(home - away goals from here = j - MAX_GOALS)
+    margin = np.convolve(_poisson(lam * share), _poisson(lam * (1.0 - share))[::-1])
+    ahead = np.cumsum(margin[::-1])[::-1]        # ahead[j] = P(margin >= j - MAX_GOALS)
+    out = np.empty(2 * DIFF_MAX + 1)
+    tie_ot = ot_win(share, OT_SECONDS)
+    for i, diff in enumerate(range(-DIFF_MAX, DIFF_MAX + 1)):
+        j = MAX_GOALS - diff                      # margin index where the game ends tied
+        win = ahead[j + 1] if j + 1 < len(ahead) else 0.0
+        out[i] = win + margin[j] * tie_ot
+    return out
+
+
+def scoring_share(p_home: float) -> float:
+    """Home share of total scoring that makes a fresh 0-0 game worth `p_home`."""
+    lo, hi = 0.01, 0.99
+    for _ in range(50):
+        mid = (lo + hi) / 2.0
+        if reg_win_by_diff(mid, REG_SECONDS)[DIFF_MAX] < p_home:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2.0
+
+
+def _lerp_index(x: float, lo: float, step: float, n: int):
+    f = min(max((x - lo) / step, 0.0), n - 1.0)
+    i = min(int(f), n - 2)
+    return i, f - i
+
+
+class LiveTable:
+    """reg[p, diff, t] = home win prob; ot[p, t] (tied, regular-season OT); share[p] (playoff OT)."""
+
+    def __init__(self, reg: np.ndarray, ot: np.ndarray, share: np.ndarray):
+        self.reg, self.ot, self.share = reg, ot, share
+
+    @classmethod
+    def build(cls) -> "LiveTable":
+        n_t = REG_SECONDS // T_STEP + 1
+        n_ot = OT_SECONDS // OT_STEP + 1
+        reg = np.empty((N_P, 2 * DIFF_MAX + 1, n_t), dtype=np.float32)
+        ot = np.empty((N_P, n_ot), dtype=np.float32)
+        share = np.empty(N_P, dtype=np.float32)
+        for i in range(N_P):
+            s = scoring_share(P_MIN + i * P_STEP)
+            share[i] = s
+            for t in range(n_t):
+                reg[i, :, t] = reg_win_by_diff(s, t * T_STEP)
+            for t in range(n_ot):
+                ot[i, t] = ot_win(s, t * OT_STEP)
+        return cls(reg, ot, share)
+
+    @staticmethod
+    def _meta() -> dict:
+        return {
+            "dtype": "float32-le",
+            "shape": [N_P, 2 * DIFF_MAX + 1, REG_SECONDS // T_STEP + 1],
+            "p_min": P_MIN, "p_step": P_STEP, "diff_max": DIFF_MAX, "t_step": T_STEP, "ot_step": OT_STEP,
+            "goals_per_60": TEAM_GOALS_PER_60, "ot_rate_mult": OT_RATE_MULT, "shootout_home": SHOOTOUT_HOME,
+        }
+
+    def save(self, bin_path: Path = LIVE_TABLE_PATH, meta_path: Path = LIVE_META_PATH) -> None:
+        bin_path.parent.mkdir(parents=True, exist_ok=True)
+        self.reg.astype("<f4").tofile(bin_path)
+        meta = self._meta()
+        meta["ot"] = [[round(float(v), 5) for v in row] for row in self.ot]
+        meta["share"] = [round(float(v), 5) for v in self.share]
+        save_json(meta_path, meta)
+
+    @classmethod
+    def load_or_build(cls, bin_path: Path = LIVE_TABLE_PATH, meta_path: Path = LIVE_META_PATH) -> "LiveTable":
+        """Load the saved table; rebuild (and save) it when missing or built with other knobs."""
+        meta = load_json(meta_path, None) if bin_path.exists() else None
+        want = cls._meta()
+        if meta and all(meta.get(k) == v for k, v in want.items()):
+            reg = np.fromfile(bin_path, dtype="<f4")
+            if reg.size == math.prod(want["shape"]):
+                return cls(reg.reshape(want["shape"]),
+                           np.asarray(meta["ot"], dtype=np.float32), np.asarray(meta["share"], dtype=np.float32))
+        table = cls.build()
+        table.save(bin_path, meta_path)
+        return table
+
+    def win_prob(self, p_home: float, diff: int, seconds_left: float, overtime: bool = False,
+                 playoff: bool = False) -> float:
+        """Home win prob. In overtime `seconds_left` is OT time left (0 = shootout)."""
+        pi, pf = _lerp_index(p_home, P_MIN, P_STEP, N_P)
+        if overtime:
+            if diff:
+                return 1.0 if diff > 0 else 0.0
+            if playoff:
+                return float(self.share[pi] * (1 - pf) + self.share[pi + 1] * pf)
+            ti, tf = _lerp_index(seconds_left, 0.0, OT_STEP, self.ot.shape[1])
+            grid = self.ot[pi:pi + 2, ti:ti + 2]
+        else:
+            d = max(-DIFF_MAX, min(DIFF_MAX, int(diff))) + DIFF_MAX
+            ti, tf = _lerp_index(seconds_left, 0.0, T_STEP, self.reg.shape[2])
+            grid = self.reg[pi:pi + 2, d, ti:ti + 2]
+        top = grid[0, 0] * (1 - tf) + grid[0, 1] * tf
+        bot = grid[1, 0] * (1 - tf) + grid[1, 1] * tf
+        return float(top * (1 - pf) + bot * pf)
+
+
+def game_clock(game: dict) -> Optional[dict]:
+    """Map a score-feed game to (overtime?, seconds left) in the table's terms."""
+    clock = nhl_api.get_live_clock(game)
+    if clock is None:
+        return None
+    period, secs, intermission = clock
+    if intermission:
+        secs = 0
+    if period <= 3:
+        return {"period": period, "overtime": False, "seconds_left": (3 - period) * 1200 + secs}
+    return {"period": period, "overtime": True, "seconds_left": secs}
+
+
+class LiveBoard:
+    """Pregame probabilities (fixed at first sight of each game) + live table lookups."""
+
+    def __init__(self, table: LiveTable, model=None):
+        self.table = table
+        self.model = model
+        self.pregame: Dict[int, float] = {}
+
+    def _pregame(self, gid: int, basic: dict, day: date) -> float:
+        if gid not in self.pregame:
+            p = 0.5
+            if self.model is not None:
+                try:
+                    p = self.model.answer({"home": basic["home_team_id"], "away": basic["away_team_id"],
+                                           "date": day.isoformat()})["p_home"]
+                except (KeyError, ValueError):
+                    pass
+            self.pregame[gid] = float(p)
+        return self.pregame[gid]
+
+    def row(self, game: dict, day: date) -> dict:
+        basic = nhl_api.parse_game_basic(game)
+        gid = int(basic["gamePk"])
+        p0 = self._pregame(gid, basic, day)
+        h, a = int(basic["home_score"] or 0), int(basic["away_score"] or 0)
+        out = {
+            "gamePk": gid,
+            "state": basic["status"],
+            "home": basic["home_team_abbrev"] or basic["home_team_name"],
+            "away": basic["away_team_abbrev"] or basic["away_team_name"],
+            "home_score": h,
+            "away_score": a,
+            "p_home_pregame": round(p0, 4),
+            "p_home": round(p0, 4),
+        }
+        if nhl_api.is_final(game):
+            out["p_home"] = 1.0 if h > a else 0.0
+        elif nhl_api.is_live(game):
+            clock = game_clock(game)
+            if clock is not None:
+                out.update(clock)
+                out["p_home"] = round(self.table.win_prob(p0, h - a, clock["seconds_left"], clock["overtime"],
+                                                          playoff=game.get("gameType") == 3), 4)
+        return out
+
+    def slate(self, day: date) -> dict:
+        games = nhl_api.get_score_for_date(day)
+        return {
+            "generated_at": datetime.now(tzutc()).isoformat().replace("+00:00", "Z"),
+            "date": day.isoformat(),
+            "games": [self.row(g, day) for g in games],
+        }
+
+
+def watch(board: LiveBoard, day: date, interval: float, once: bool = False) -> None:
+    """Rewrite live.json every `interval` seconds until every game on `day` is final.
+
+    A poll that fails (feed error, malformed game) is logged and skipped; the last
+    live.json stays in place and the next poll runs on schedule.
+    """
+    while True:
+        try:
+            payload = board.slate(day)
+        except Exception as e:
+            print(f"WARN: poll failed ({type(e).__name__}: {e}); keeping the last {LIVE_PATH.name}")
+            if once:
+                return
+            time.sleep(interval)
+            continue
+        LIVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        LIVE_PATH.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        for g in payload["games"]:
+            tag = f"P{g['period']} {g['seconds_left'] // 60:>2}m" if "period" in g else g["state"]
+            print(f"{g['away']:>4} {g['away_score']}-{g['home_score']} {g['home']:<4} {tag:>8}  "
+                  f"home {g['p_home']:.1%} (pregame {g['p_home_pregame']:.1%})")
+        games = payload["games"]
+        if once or not games or all(g["state"].upper() in ("FINAL", "OFF") for g in games):
+            return
+        print()
+        time.sleep(interval)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Live in-game win probabilities from a precomputed state table")
+    ap.add_argument("--date", default=None, help="slate date (default: today)")
+    ap.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls")
+    ap.add_argument("--once", action="store_true", help="poll once and exit")
+    ap.add_argument("--build-table", action="store_true", help="regenerate the table and exit")
+    args = ap.parse_args()
+
+    if args.build_table:
+        t0 = time.perf_counter()
+        LiveTable.build().save()
+        print(f"Wrote {LIVE_TABLE_PATH} in {time.perf_counter() - t0:.2f}s")
+        return
+
+    from serve import MatchupModel
+    from build_picks import load_state
+
+    try:
+        model = MatchupModel(load_state())
+    except ValueError as e:
+        print(f"WARN: no pregame model ({e}); using 0.5 pregame")
+        model = None
+    day = date.fromisoformat(args.date) if args.date else date.today()
+    watch(LiveBoard(LiveTable.load_or_build(), model), day, args.interval, once=args.once)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,23 @@ from typing import List, Optional, Tuple, Dict, Any, Set
 BASE = "https://api-web.nhle.com/v1"
 _SESSION = requests.Session()
 
-def _get(url: str, params: Optional[dict] = None, max_retries: int = 6) -> dict:
+def _remaining(deadline: Optional[float]) -> float:
+    """Seconds left before a time.monotonic() deadline (inf if none); raises once it has passed."""
+    if deadline is None:
+        return float("inf")
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise TimeoutError("deadline passed")
+    return left
+
+def _get(url: str, params: Optional[dict] = None, max_retries: int = 6, deadline: Optional[float] = None) -> dict:
     backoff = 0.75
     for attempt in range(max_retries):
-        r = _SESSION.get(url, params=params, timeout=30)
+        r = _SESSION.get(url, params=params, timeout=min(30.0, _remaining(deadline)))
         if r.status_code == 429:
             ra = r.headers.get("Retry-After")
             sleep_s = float(ra) if ra and ra.replace(".","",1).isdigit() else backoff
-            time.sleep(min(10.0, sleep_s))
+            time.sleep(min(10.0, sleep_s, _remaining(deadline)))
             backoff = min(10.0, backoff * 1.8)
             continue
         r.raise_for_status()
@@ -34,15 +43,16 @@ def get_score_for_date(day: date) -> List[dict]:
     games = data.get("games", [])
     return games if isinstance(games, list) else []
 
-def get_games_range_weekly(start: date, end: date) -> List[dict]:
-    # Use weekly schedule payloads to minimize calls.
+def get_games_range_weekly(start: date, end: date, deadline: Optional[float] = None) -> List[dict]:
+    # Use weekly schedule payloads to minimize calls. `deadline` (time.monotonic())
+    # bounds the whole walk: TimeoutError once it passes.
     out: List[dict] = []
     seen: Set[int] = set()
     cur = start
     safety = 0
     while cur <= end and safety < 200:
         safety += 1
-        payload = _get(f"{BASE}/schedule/{cur.isoformat()}")
+        payload = _get(f"{BASE}/schedule/{cur.isoformat()}", deadline=deadline)
         week_days = payload.get("gameWeek", []) or []
         if not week_days:
             cur += timedelta(days=7)
@@ -73,7 +83,7 @@ def get_games_range_weekly(start: date, end: date) -> List[dict]:
                 out.append(g)
 
         cur = max_day + timedelta(days=1)
-        time.sleep(0.15)
+        time.sleep(min(0.15, _remaining(deadline)))
     return out
 
 def parse_game_basic(game: dict) -> dict:
@@ -100,8 +110,10 @@ def parse_game_basic(game: dict) -> dict:
         "date": gdate,
         "status": status,
         "home_team_id": int(home.get("id")) if home.get("id") is not None else None,
+        "home_team_abbrev": home.get("abbrev"),
         "home_team_name": home.get("name") or home.get("placeName", {}).get("default") or home.get("commonName", {}).get("default"),
         "away_team_id": int(away.get("id")) if away.get("id") is not None else None,
+        "away_team_abbrev": away.get("abbrev"),
         "away_team_name": away.get("name") or away.get("placeName", {}).get("default") or away.get("commonName", {}).get("default"),
         "home_score": home.get("score"),
         "away_score": away.get("score"),
@@ -134,17 +146,34 @@ def get_final_score(game: dict) -> Optional[Tuple[int, int]]:
     except Exception:
         return None
 
+def is_live(game: dict) -> bool:
+    state = (game.get("gameState") or game.get("status") or "").upper()
+    return state in ("LIVE", "CRIT")
+
+def get_live_clock(game: dict) -> Optional[Tuple[int, int, bool]]:
+    """(period number, seconds left in that period, in intermission) from a score-feed game."""
+    pd = game.get("periodDescriptor") or {}
+    period = pd.get("number") or game.get("period")
+    clock = game.get("clock") or {}
+    try:
+        secs = clock.get("secondsRemaining")
+        if secs is None and isinstance(clock.get("timeRemaining"), str) and ":" in clock["timeRemaining"]:
+            mm, ss = clock["timeRemaining"].split(":", 1)
+            secs = int(mm) * 60 + int(ss)
+        if period is None or secs is None:
+            return None
+        return int(period), int(secs), bool(clock.get("inIntermission"))
+    except Exception:
+        return None
+
 
 # --- Goalie helpers (free endpoints) ---
 def get_goalie_stats_current(session=None, categories="savePctg,gamesPlayed", limit=-1):
     """Fetch current goalie stats leaders. limit=-1 requests all results."""
-    s = session or _session()
-    url = f"{BASE_URL}/goalie-stats-leaders/current"
+    url = f"{BASE}/goalie-stats-leaders/current"
     params = {"categories": categories, "limit": str(limit)}
-    return _get_json(url, params=params, session=s)
+    return _get(url, params=params)
 
 def get_boxscore(game_id, session=None):
     """Fetch gamecenter boxscore (includes goalie 'starter' flags once available)."""
-    s = session or _session()
-    url = f"{BASE_URL}/gamecenter/{game_id}/boxscore"
-    return _get_json(url, session=s)
+    return _get(f"{BASE}/gamecenter/{game_id}/boxscore")
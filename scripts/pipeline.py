@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+class StageError(RuntimeError):
+    """A stage failed (or timed out) and had no fallback."""
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One node of the build DAG.
+
+    `fn` is called with the values of `inputs` (in order) and its return value is
+    published under the stage's `name`, which later stages list as an input.
+    On error or timeout, `fallback(error, *inputs)` supplies the value instead.
+    A timeout only stops waiting; long stages should also check a deadline.
+    """
+    name: str
+    fn: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Optional[Callable[..., Any]] = None
+
+
+def _launch(stage: Stage, args: list, done: "queue.Queue") -> None:
+    """Run one stage on a daemon thread, so an abandoned (timed-out) stage never
+    holds up interpreter exit the way pooled executor threads do."""
+    def target():
+        try:
+            out = stage.fn(*args)
+        except Exception as e:
+            done.put((stage.name, e, None))
+        else:
+            done.put((stage.name, None, out))
+    threading.Thread(target=target, name=f"stage-{stage.name}", daemon=True).start()
+
+
+def run_stages(stages: Sequence[Stage], values: Optional[Dict[str, Any]] = None,
+               max_workers: int = 6) -> Tuple[Dict[str, Any], Dict[str, dict]]:
+    """Run stages as soon as their inputs exist, independent ones concurrently.
+
+    Returns (values, report). A timed-out stage's thread is abandoned rather than
+    killed and its late result is ignored, so stages with side effects should work
+    on private copies and honour a deadline of their own. Raises StageError when a
+    stage fails and has no fallback (or its fallback fails too), or when inputs
+    can never be satisfied.
+    """
+    values = dict(values or {})
+    report: Dict[str, dict] = {}
+    pending = {s.name: s for s in stages}
+    running: Dict[str, Tuple[Stage, float]] = {}
+    done: "queue.Queue" = queue.Queue()
+
+    def settle(stage: Stage, started: float, err: Optional[BaseException], out: Any = None) -> None:
+        entry = {"status": "ok", "seconds": round(time.monotonic() - started, 3)}
+        if err is not None:
+            if stage.fallback is None:
+                raise StageError(f"stage {stage.name} failed: {err}") from err
+            entry["status"] = "timeout" if isinstance(err, TimeoutError) else "fallback"
+            entry["error"] = str(err) or type(err).__name__
+            try:
+                out = stage.fallback(err, *[values[i] for i in stage.inputs])
+            except Exception as e:
+                raise StageError(f"stage {stage.name} failed ({err}) and its fallback failed: {e}") from e
+        values[stage.name] = out
+        report[stage.name] = entry
+
+    while pending or running:
+        for name, stage in list(pending.items()):
+            if len(running) >= max_workers:
+                break
+            if all(i in values for i in stage.inputs):
+                running[name] = (stage, time.monotonic())
+                del pending[name]
+                _launch(stage, [values[i] for i in stage.inputs], done)
+        if not running:
+            raise StageError(f"unsatisfiable inputs for stages {sorted(pending)}")
+
+        now = time.monotonic()
+        deadlines = [t0 + s.timeout for s, t0 in running.values() if s.timeout is not None]
+        try:
+            name, err, out = done.get(timeout=max(0.0, min(deadlines) - now) if deadlines else None)
+        except queue.Empty:
+            pass
+        else:
+            if name in running:  # otherwise it already timed out; drop the late result
+                stage, t0 = running.pop(name)
+                settle(stage, t0, err, out)
+
+        now = time.monotonic()
+        for name, (stage, t0) in list(running.items()):
+            if stage.timeout is not None and now - t0 >= stage.timeout:
+                running.pop(name)
+                settle(stage, t0, TimeoutError(f"{stage.name} exceeded {stage.timeout:g}s"))
+    return values, report
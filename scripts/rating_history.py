@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import math
+import mmap
+import sys
+from array import array
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from cache import load_json, save_json
+
+TEAM_SLOTS = 40    # fixed row width; NHL has 32 franchises
+ITEM_SIZE = 4      # float32
+
+
+class RatingHistory:
+    """Per-day rating snapshots for one season in a fixed-width float32 file.
+
+    Row i holds every team's end-of-day rating for `start + i` days (NaN = not rated
+    yet); column j is the team in `teams[j]`. The `.f32` file is raw little-endian
+    float32 so it can be memory-mapped here and read as a Float32Array on the site;
+    the `.json` sidecar carries the start date and slot -> team id table.
+    """
+
+    def __init__(self, directory: Path, season: str, start: date, slots: int = TEAM_SLOTS):
+        self.bin_path = directory / f"ratings_{season}.f32"
+        self.meta_path = directory / f"ratings_{season}.json"
+        meta = load_json(self.meta_path, None) if self.bin_path.exists() else None
+        if meta:
+            self.start = date.fromisoformat(meta["start"])
+            self.slots = int(meta["slots"])
+            self.teams: List[int] = [int(t) for t in meta["teams"]]
+        else:
+            self.start = start
+            self.slots = slots
+            self.teams = []
+        self._slot_of = {tid: i for i, tid in enumerate(self.teams)}
+        self._fh = None
+
+    # --- writing ---
+    def __enter__(self) -> "RatingHistory":
+        self.bin_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.bin_path, "r+b" if self.bin_path.exists() else "w+b")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._fh.close()
+        self._fh = None
+        self.save_meta()
+
+    @property
+    def row_bytes(self) -> int:
+        return self.slots * ITEM_SIZE
+
+    @property
+    def days(self) -> int:
+        return self.bin_path.stat().st_size // self.row_bytes if self.bin_path.exists() else 0
+
+    @property
+    def end(self) -> Optional[date]:
+        n = self.days
+        return self.start + timedelta(days=n - 1) if n else None
+
+    def slot(self, team_id: int) -> Optional[int]:
+        s = self._slot_of.get(team_id)
+        if s is None and len(self.teams) < self.slots:
+            s = len(self.teams)
+            self.teams.append(team_id)
+            self._slot_of[team_id] = s
+        return s
+
+    def _pack(self, row: array) -> bytes:
+        if sys.byteorder != "little":
+            row = array("f", row)
+            row.byteswap()
+        return row.tobytes()
+
+    def write_day(self, day: date, ratings: Dict[int, float]) -> None:
+        """Store end-of-day ratings for `day`; skipped days repeat the previous row."""
+        self.write_days({day: ratings})
+
+    def write_days(self, snapshots: Dict[date, Dict[int, float]]) -> None:
+        """write_day for many days in one seek + write: rows from the first to the last
+        snapshot are packed together, skipped days repeating the row before them."""
+        days = sorted(d for d in snapshots if d >= self.start)
+        if not days:
+            return
+        fh = self._fh
+        n = fh.seek(0, 2) // self.row_bytes
+        idx0 = (days[0] - self.start).days
+        prev = self._pack(self._read_row(fh, n - 1)) if n else self._pack(array("f", [math.nan] * self.slots))
+        chunks = [prev * (idx0 - n)] if idx0 > n else []
+        start = min(idx0, n)
+        last_idx = idx0 - 1
+        for day in days:
+            idx = (day - self.start).days
+            if idx > last_idx + 1:
+                chunks.append(prev * (idx - last_idx - 1))
+            row = array("f", [math.nan] * self.slots)
+            for tid, r in snapshots[day].items():
+                s = self.slot(int(tid))
+                if s is not None:
+                    row[s] = float(r)
+            prev = self._pack(row)
+            chunks.append(prev)
+            last_idx = idx
+        fh.seek(start * self.row_bytes)
+        fh.write(b"".join(chunks))
+
+    def _read_row(self, fh, idx: int) -> array:
+        fh.seek(idx * self.row_bytes)
+        row = array("f")
+        row.frombytes(fh.read(self.row_bytes))
+        if sys.byteorder != "little":
+            row.byteswap()
+        return row
+
+    def truncate(self, day: date) -> None:
+        """Drop snapshots from `day` onwards (used before replaying a corrected range)."""
+        if not self.bin_path.exists():
+            return
+        idx = max(0, (day - self.start).days)
+        with open(self.bin_path, "r+b") as fh:
+            fh.truncate(idx * self.row_bytes)
+
+    def save_meta(self) -> None:
+        save_json(self.meta_path, {
+            "start": self.start.isoformat(),
+            "slots": self.slots,
+            "dtype": "float32-le",
+            "days": self.days,
+            "teams": self.teams,
+        })
+
+    # --- zero-copy reads ---
+    def view(self) -> memoryview:
+        """Memory-map the store as a flat float32 view (row-major, `slots` per day).
+
+        Day ranges are contiguous slices, a team's series is a strided slice; neither
+        copies. Assumes a little-endian host, like the browser reader.
+        """
+        if not self.days:
+            return memoryview(array("f"))
+        with open(self.bin_path, "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mm).cast("f")
+
+    def day_range(self, view: memoryview, first: date, last: date) -> memoryview:
+        i0 = max(0, (first - self.start).days)
+        i1 = min(self.days, (last - self.start).days + 1)
+        return view[i0 * self.slots:max(i0, i1) * self.slots]
+
+    def team_series(self, view: memoryview, team_id: int) -> Optional[memoryview]:
+        s = self._slot_of.get(team_id)
+        if s is None:
+            return None
+        return view[s::self.slots]
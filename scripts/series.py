@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence, Tuple
+
+WINS_NEEDED = 4
+# Games 1-7 from the home-ice team's side: 2-2-1-1-1
+HOME_PATTERN = (True, True, False, False, True, False, True)
+
+
+@lru_cache(maxsize=65536)
+def series_distribution(p_home: float, p_road: float) -> Tuple[float, Tuple[float, ...], Tuple[float, ...]]:
+    """Exact best-of-7 outcome for the team holding home ice.
+
+    p_home / p_road are that team's single-game win probabilities at home / on the
+    road. Forward DP over (wins, losses) states; the result is memoised on the two
+    probabilities, so identical pairings (and repeat queries) are free.
+    Returns (p_series_win, p_win_in[4..7], p_lose_in[4..7]).
+    """
+    reach = {(0, 0): 1.0}
+    win_in = [0.0] * WINS_NEEDED
+    lose_in = [0.0] * WINS_NEEDED
+    for game in range(2 * WINS_NEEDED - 1):
+        p = p_home if HOME_PATTERN[game] else p_road
+        nxt: Dict[Tuple[int, int], float] = {}
+        for (w, l), q in reach.items():
+            for (w2, l2), pq in (((w + 1, l), q * p), ((w, l + 1), q * (1.0 - p))):
+                if w2 == WINS_NEEDED:
+                    win_in[game + 1 - WINS_NEEDED] += pq
+                elif l2 == WINS_NEEDED:
+                    lose_in[game + 1 - WINS_NEEDED] += pq
+                else:
+                    nxt[(w2, l2)] = nxt.get((w2, l2), 0.0) + pq
+        reach = nxt
+    return sum(win_in), tuple(win_in), tuple(lose_in)
+
+
+def pairing_table(team_ids: Sequence[int], game_prob: Callable[[int, int], float]) -> Dict[str, list]:
+    """Series odds for every ordered pairing; row team holds home ice.
+
+    game_prob(home_id, away_id) is the home team's single-game win probability.
+    p_series[i][j] = P(team i beats team j), length[i][j] = P(series ends in 4..7).
+    """
+    ids = list(team_ids)
+    home = {(a, b): game_prob(a, b) for a in ids for b in ids if a != b}
+    p_series: List[list] = []
+    length: List[list] = []
+    for a in ids:
+        row_p, row_len = [], []
+        for b in ids:
+            if a == b:
+                row_p.append(None)
+                row_len.append(None)
+                continue
+            p_win, win_in, lose_in = series_distribution(home[(a, b)], 1.0 - home[(b, a)])
+            row_p.append(round(p_win, 4))
+            row_len.append([round(x + y, 4) for x, y in zip(win_in, lose_in)])
+        p_series.append(row_p)
+        length.append(row_len)
+    return {"teams": ids, "p_series": p_series, "length": length}
+
+
+def bracket_odds(bracket: Sequence[int], series_p: Callable[[int, int], float],
+                 rank: Dict[int, int]) -> Dict[int, List[float]]:
+    """Probability each team survives each round of a single-elimination bracket.
+
+    `bracket` lists team ids in bracket order (adjacent pairs meet in round 1, and
+    so on); `rank` decides home ice (lower rank hosts); series_p(a, b) is P(a beats
+    b with a holding home ice), e.g. a lookup into pairing_table.
+    """
+    if len(bracket) < 2 or len(bracket) & (len(bracket) - 1):
+        raise ValueError("bracket size must be a power of two")
+    reach = {t: 1.0 for t in bracket}
+    groups = [[t] for t in bracket]
+    out: Dict[int, List[float]] = {t: [] for t in bracket}
+    while len(groups) > 1:
+        merged, nxt = [], {}
+        for g1, g2 in zip(groups[::2], groups[1::2]):
+            for mine, theirs in ((g1, g2), (g2, g1)):
+                for a in mine:
+                    beat = sum(
+                        reach[b] * (series_p(a, b) if rank[a] <= rank[b] else 1.0 - series_p(b, a))
+                        for b in theirs
+                    )
+                    nxt[a] = reach[a] * beat
+            merged.append(g1 + g2)
+        reach, groups = nxt, merged
+        for t in bracket:
+            out[t].append(reach[t])
+    return out
@@ -0,0 +1,276 @@
+"""Local matchup query service backed by the in-memory model in state.json.
+
+    python scripts/serve.py --port 8765
+    curl 'localhost:8765/matchup?home=TOR&away=MTL&date=2026-01-05&home_rest=0'
+    curl -d '[{"home": "TOR", "away": "MTL"}, {"home": 10, "away": 8, "away_goalie": 8478048}]' localhost:8765/batch
+    curl 'localhost:8765/series?home=TOR&away=MTL'       # best-of-7, `home` holds home ice
+    curl -d '{"teams": ["FLA", "TBL", "BOS", "TOR"]}' localhost:8765/bracket
+    curl 'localhost:8765/ratings?date=2026-01-05&to=2026-01-31&team=TOR'   # end-of-day Elo history
+
+state.json is read once at startup (POST /reload to re-read after a build). Answers use
+the same why_breakdown_homeprob decomposition as the published picks.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from build_picks import (
+    CFG,
+    RATING_HISTORY_DIR,
+    STATE_PATH,
+    compute_form_and_rest,
+    decode_team_logs,
+    fatigue_points,
+    form_points,
+    get_team_home_adv,
+    load_goalie_profiles,
+    load_state,
+    season_start_guess,
+    series_game_prob,
+    why_breakdown_homeprob,
+)
+from goalies import goalie_adjustment_points, team_goalie_candidates
+from rating_history import RatingHistory
+from series import bracket_odds, series_distribution
+
+QUERY_CACHE_SIZE = 8192
+FORM_CACHE_SIZE = 64
+MAX_BATCH = 1000
+
+
+class MatchupModel:
+    def __init__(self, state: dict):
+        seasons = state.get("seasons") or {}
+        if not seasons:
+            raise ValueError("state.json has no seasons; run build_picks.py first")
+        self.season = max(seasons)
+        sstate = seasons[self.season]
+        self.last_built = sstate.get("last_built")
+        self.ratings = {int(k): float(v) for k, v in (sstate.get("ratings") or {}).items()}
+        self.home_model = sstate.get("home_model") or {}
+        self.logs = decode_team_logs(sstate.get("team_logs"))
+        self.teams = {int(k): v for k, v in (state.get("teams") or {}).items()}
+        self.by_abbrev = {v["abbrev"].upper(): k for k, v in self.teams.items() if v.get("abbrev")}
+        self.goalies = load_goalie_profiles(state)
+        self.history = RatingHistory(RATING_HISTORY_DIR, self.season, season_start_guess(self.season))
+
+        # Per-instance caches so a reload starts cold
+        self.form_for = lru_cache(maxsize=FORM_CACHE_SIZE)(self._form_for)
+        self.query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._query)
+
+    def team_id(self, team) -> int:
+        s = str(team).strip()
+        if s.isdigit():
+            return int(s)
+        tid = self.by_abbrev.get(s.upper())
+        if tid is None:
+            raise ValueError(f"unknown team {team!r}")
+        return tid
+
+    def _form_for(self, day: str) -> dict[int, dict]:
+        # answer() only admits days after last_built, so this only guards a hand-edited state
+        logs = {tid: [e for e in gs if e["date"] < day] for tid, gs in self.logs.items()}
+        return compute_form_and_rest(date.fromisoformat(day), logs)
+
+    def _goalie(self, team_id: int, goalie_id: int | None):
+        if goalie_id is not None:
+            gp = self.goalies.get(goalie_id)
+            if gp is None:
+                raise ValueError(f"unknown goalie {goalie_id}")
+            return gp
+        abbrev = (self.teams.get(team_id) or {}).get("abbrev")
+        cands = team_goalie_candidates(abbrev, self.goalies, limit=1)
+        return cands[0] if cands else None
+
+    def _side(self, team_id: int, is_home: bool, form: dict, rest: int | None, goalie_id: int | None) -> dict:
+        f = form.get(team_id)
+        rest_days = rest if rest is not None else (f["rest_days"] if f else None)
+        gp = self._goalie(team_id, goalie_id)
+        return {
+            "id": team_id,
+            "abbrev": (self.teams.get(team_id) or {}).get("abbrev"),
+            "elo": float(self.ratings.get(team_id, CFG.base_rating)),
+            "form_pts": form_points(f, is_home=is_home),
+            "rest_days": rest_days,
+            "fatigue_pts": fatigue_points(rest_days),
+            "goalie_id": gp.player_id if gp else None,
+            "goalie_pts": goalie_adjustment_points(gp),
+        }
+
+    def _query(self, home_id: int, away_id: int, day: str, home_rest: int | None, away_rest: int | None,
+               home_goalie: int | None, away_goalie: int | None) -> dict:
+        form = self.form_for(day)
+        h = self._side(home_id, True, form, home_rest, home_goalie)
+        a = self._side(away_id, False, form, away_rest, away_goalie)
+        h_team = get_team_home_adv(home_id, self.home_model)
+        why = why_breakdown_homeprob(h["elo"], a["elo"], h["form_pts"], a["form_pts"], h["fatigue_pts"], a["fatigue_pts"],
+                                     h_team, h["goalie_pts"], a["goalie_pts"])
+        return {
+            "date": day,
+            "home": h,
+            "away": a,
+            "home_adv": h_team,
+            "p_home": why["final"],
+            "p_away": 1.0 - why["final"],
+            "why": why,
+        }
+
+    def series(self, home, away) -> dict:
+        """Exact best-of-7 odds; `home` holds home ice (games 1, 2, 5, 7)."""
+        h, a = self.team_id(home), self.team_id(away)
+        if h == a:
+            raise ValueError("teams must differ")
+        p_home = series_game_prob(h, a, self.ratings, self.home_model)
+        p_road = 1.0 - series_game_prob(a, h, self.ratings, self.home_model)
+        p_win, win_in, lose_in = series_distribution(p_home, p_road)
+        return {
+            "home_ice": h,
+            "opponent": a,
+            "p_game_home": p_home,
+            "p_game_road": p_road,
+            "p_series": p_win,
+            "win_in": dict(zip(range(4, 8), win_in)),
+            "lose_in": dict(zip(range(4, 8), lose_in)),
+        }
+
+    def bracket(self, teams: list, rank: list | None = None) -> dict:
+        """Round-by-round survival odds. Home ice follows `rank` (default: bracket rating order)."""
+        ids = [self.team_id(t) for t in teams]
+        order = [self.team_id(t) for t in rank] if rank else sorted(ids, key=lambda t: -self.ratings.get(t, CFG.base_rating))
+        ranks = {t: i for i, t in enumerate(order)}
+        odds = bracket_odds(ids, lambda a, b: self.series(a, b)["p_series"], ranks)
+        return {str(t): odds[t] for t in ids}
+
+    def rating_history(self, first: str, last: str | None = None, team=None) -> dict:
+        """End-of-day ratings for first..last (inclusive) from the season's float32 store.
+
+        Rows come from zero-copy slices of the memory-mapped file; only the requested
+        days (and team column) are converted to JSON. NaN (not rated yet) becomes null.
+        """
+        hist = self.history
+        d0 = max(date.fromisoformat(first), hist.start)
+        d1 = date.fromisoformat(last) if last else date.fromisoformat(first)
+        if d1 < date.fromisoformat(first):
+            raise ValueError("`to` must not be before `date`")
+        rows = hist.day_range(hist.view(), d0, d1)
+        n = len(rows) // hist.slots if hist.slots else 0
+        tids = [self.team_id(team)] if team is not None else list(hist.teams)
+        out = {}
+        for tid in tids:
+            col = hist.team_series(rows, tid) if n else None
+            out[str(tid)] = [None if v != v else round(v, 2) for v in col.tolist()] if col is not None else [None] * n
+        return {
+            "season": self.season,
+            "days": [(d0 + timedelta(days=i)).isoformat() for i in range(n)],
+            "ratings": out,
+        }
+
+    def answer(self, q: dict) -> dict:
+        """Normalise one query dict (query-string or JSON) and return the cached answer."""
+        def opt_int(key):
+            v = q.get(key)
+            return None if v in (None, "") else int(v)
+
+        day = str(q.get("date") or date.today().isoformat())
+        date.fromisoformat(day)
+        # Ratings, home_model and the last-10 logs are all as of last_built; an earlier day
+        # would mix today's Elo with a truncated form window, so it is refused
+        if self.last_built and day <= self.last_built:
+            raise ValueError(f"date must be after last_built ({self.last_built})")
+        home_id = self.team_id(q["home"])
+        away_id = self.team_id(q["away"])
+        if home_id == away_id:
+            raise ValueError("home and away must differ")
+        return self.query(home_id, away_id, day, opt_int("home_rest"), opt_int("away_rest"),
+                          opt_int("home_goalie"), opt_int("away_goalie"))
+
+
+MODEL: MatchupModel | None = None
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _send(self, code: int, obj) -> None:
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        n = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(n) or b"null")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        try:
+            if url.path == "/matchup":
+                q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                self._send(200, MODEL.answer(q))
+            elif url.path == "/series":
+                q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                self._send(200, MODEL.series(q["home"], q["away"]))
+            elif url.path == "/ratings":
+                q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                self._send(200, MODEL.rating_history(q["date"], q.get("to"), q.get("team")))
+            elif url.path == "/teams":
+                self._send(200, {str(k): v for k, v in MODEL.teams.items()})
+            elif url.path == "/health":
+                ci = MODEL.query.cache_info()
+                self._send(200, {"season": MODEL.season, "last_built": MODEL.last_built, "teams": len(MODEL.ratings),
+                                 "cache": {"hits": ci.hits, "misses": ci.misses, "size": ci.currsize}})
+            else:
+                self._send(404, {"error": "not found"})
+        except (KeyError, ValueError) as e:
+            self._send(400, {"error": f"bad query: {e}"})
+
+    def do_POST(self):
+        global MODEL
+        url = urlparse(self.path)
+        try:
+            if url.path == "/batch":
+                queries = self._body()
+                if not isinstance(queries, list) or len(queries) > MAX_BATCH:
+                    raise ValueError(f"expected a JSON list of at most {MAX_BATCH} queries")
+                out = []
+                for q in queries:
+                    try:
+                        out.append(MODEL.answer(q))
+                    except (KeyError, ValueError, TypeError) as e:
+                        out.append({"error": f"bad query: {e}"})
+                self._send(200, out)
+            elif url.path == "/bracket":
+                body = self._body() or {}
+                self._send(200, MODEL.bracket(body["teams"], body.get("rank")))
+            elif url.path == "/reload":
+                MODEL = MatchupModel(load_state())
+                self._send(200, {"season": MODEL.season, "last_built": MODEL.last_built})
+            else:
+                self._send(404, {"error": "not found"})
+        except (KeyError, ValueError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def main():
+    global MODEL
+    ap = argparse.ArgumentParser(description="Serve matchup probabilities from state.json")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    args = ap.parse_args()
+
+    MODEL = MatchupModel(load_state())
+    print(f"Loaded {STATE_PATH} (season {MODEL.season}, built {MODEL.last_built}); serving on http://{args.host}:{args.port}")
+    ThreadingHTTPServer((args.host, args.port), Handler).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
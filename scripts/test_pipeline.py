@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from pipeline import Stage, StageError, run_stages
+
+
+def _boom(*_):
+    raise RuntimeError("rebuild failed")
+
+
+def test_fallback_value_replaces_failed_stage():
+    values, report = run_stages([
+        Stage("ratings", _boom, fallback=lambda err: "stored"),
+        Stage("form", lambda r: r + "+form", inputs=("ratings",)),
+    ])
+    assert values["form"] == "stored+form"
+    assert report["ratings"]["status"] == "fallback"
+    assert report["ratings"]["error"] == "rebuild failed"
+
+
+def test_failing_fallback_surfaces_as_stage_error():
+    def no_stored(err):
+        raise RuntimeError("no stored ratings for this season")
+
+    with pytest.raises(StageError) as info:
+        run_stages([Stage("ratings", _boom, fallback=no_stored)])
+    assert isinstance(info.value.__cause__, RuntimeError)
+    assert "no stored ratings" in str(info.value)
+
+
+def test_timeout_uses_fallback_and_drops_late_result():
+    started = time.monotonic()
+    values, report = run_stages([
+        Stage("slow", lambda: time.sleep(2.0) or "late", timeout=0.2, fallback=lambda err: "fallback"),
+    ])
+    assert time.monotonic() - started < 1.5
+    assert values["slow"] == "fallback"
+    assert report["slow"]["status"] == "timeout"
+    assert report["slow"]["error"] == "slow exceeded 0.2s"
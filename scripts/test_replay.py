@@ -0,0 +1,83 @@
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bench"))
+
+import build_picks as bp  # noqa: E402
+import nhl_api  # noqa: E402
+from synthetic import SyntheticLeague  # noqa: E402
+
+
+@pytest.fixture
+def league(monkeypatch):
+    lg = SyntheticLeague(teams=12)
+    for name in ("get_games_range_weekly", "get_schedule_for_date", "get_score_for_date", "get_boxscore"):
+        monkeypatch.setattr(nhl_api, name, getattr(lg, name))
+    return lg
+
+
+def _use_dir(monkeypatch, d: Path):
+    d.mkdir()
+    monkeypatch.setattr(bp, "STATE_PATH", d / "state.json")
+    monkeypatch.setattr(bp, "RATING_HISTORY_DIR", d)
+    monkeypatch.setattr(bp, "CHECKPOINT_DIR", d)
+
+
+def _snapshot(state, target):
+    sstate = state["seasons"][bp.season_from_date(target)]
+    variants = {k: (v["ratings"], v["home_model"]) for k, v in (sstate.get("variants") or {}).items()}
+    return sstate["ratings"], sstate["home_model"], variants
+
+
+def test_replay_after_corrected_final_matches_clean_rebuild(league, monkeypatch, tmp_path):
+    start, _ = league.season_bounds(0)
+    first, second = start + timedelta(days=60), start + timedelta(days=63)
+
+    _use_dir(monkeypatch, tmp_path / "incremental")
+    bp.rebuild_ratings_to(first, {"seasons": {}})
+    game = league.games_by_day[first - timedelta(days=5)][0]
+    game["homeTeam"]["score"] += 2
+    state = bp.load_state()
+    _, note, *_ = bp.rebuild_ratings_to(second, state)
+    assert "replayed from" in note and "1 corrected finals" in note
+    incremental = _snapshot(state, second)
+    history = (tmp_path / "incremental" / f"ratings_{bp.season_from_date(second)}.f32").read_bytes()
+
+    _use_dir(monkeypatch, tmp_path / "clean")
+    clean_state = {"seasons": {}}
+    bp.rebuild_ratings_to(second, clean_state)
+    assert incremental == _snapshot(clean_state, second)
+    assert history == (tmp_path / "clean" / f"ratings_{bp.season_from_date(second)}.f32").read_bytes()
+
+
+def test_unchanged_finals_do_not_replay(league, monkeypatch, tmp_path):
+    start, _ = league.season_bounds(0)
+    _use_dir(monkeypatch, tmp_path / "state")
+    bp.rebuild_ratings_to(start + timedelta(days=30), {"seasons": {}})
+    _, note, *_ = bp.rebuild_ratings_to(start + timedelta(days=32), bp.load_state())
+    assert note.startswith("updated") and "replayed" not in note
+
+
+def test_timed_out_replay_leaves_rating_history_untouched(league, monkeypatch, tmp_path):
+    start, _ = league.season_bounds(0)
+    first = start + timedelta(days=60)
+    _use_dir(monkeypatch, tmp_path / "state")
+    bp.rebuild_ratings_to(first, {"seasons": {}})
+    path = tmp_path / "state" / f"ratings_{bp.season_from_date(first)}.f32"
+    before = path.read_bytes()
+    league.games_by_day[first - timedelta(days=5)][0]["homeTeam"]["score"] += 2
+
+    checks = []
+
+    def expire_mid_replay(deadline):
+        checks.append(deadline)
+        if len(checks) >= 2:
+            raise TimeoutError("deadline passed")
+
+    monkeypatch.setattr(nhl_api, "_remaining", expire_mid_replay)
+    with pytest.raises(TimeoutError):
+        bp.rebuild_ratings_to(first + timedelta(days=3), bp.load_state(), save=False, deadline=1.0)
+    assert path.read_bytes() == before
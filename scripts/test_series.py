@@ -0,0 +1,64 @@
+from itertools import product
+
+import pytest
+
+from series import HOME_PATTERN, bracket_odds, pairing_table, series_distribution
+
+
+def _brute_force(p_home, p_road):
+    """Play all 2^7 game sequences out; the series ends at the 4th win for either side."""
+    win_in, lose_in = [0.0] * 4, [0.0] * 4
+    for results in product((True, False), repeat=7):
+        q, w, l = 1.0, 0, 0
+        for game, won in enumerate(results):
+            p = p_home if HOME_PATTERN[game] else p_road
+            q *= p if won else 1.0 - p
+        for game, won in enumerate(results):
+            w, l = w + won, l + (not won)
+            if w == 4:
+                win_in[game - 3] += q
+                break
+            if l == 4:
+                lose_in[game - 3] += q
+                break
+    return sum(win_in), win_in, lose_in
+
+
+@pytest.mark.parametrize("p_home,p_road", [(0.6, 0.55), (0.5, 0.5), (0.72, 0.38), (0.99, 0.01)])
+def test_dp_matches_brute_force(p_home, p_road):
+    p, win_in, lose_in = series_distribution(p_home, p_road)
+    bp, bwin, blose = _brute_force(p_home, p_road)
+    assert p == pytest.approx(bp, abs=1e-12)
+    assert win_in == pytest.approx(bwin, abs=1e-12)
+    assert lose_in == pytest.approx(blose, abs=1e-12)
+    assert sum(win_in) + sum(lose_in) == pytest.approx(1.0)
+
+
+def test_even_teams_split_evenly():
+    assert series_distribution(0.5, 0.5)[0] == pytest.approx(0.5)
+
+
+def test_pairing_table_is_complementary():
+    probs = {1: 1550.0, 2: 1500.0, 3: 1460.0}
+
+    def game_prob(h, a):
+        return 1.0 / (1.0 + 10 ** ((probs[a] - probs[h] - 35.0) / 400.0))
+
+    table = pairing_table([1, 2, 3], game_prob)
+    for i in range(3):
+        assert table["p_series"][i][i] is None
+        for j in range(3):
+            if i != j:
+                assert sum(table["length"][i][j]) == pytest.approx(1.0, abs=1e-3)
+
+
+def test_bracket_survival_sums_to_round_size():
+    teams = [1, 2, 3, 4, 5, 6, 7, 8]
+    odds = bracket_odds(teams, lambda a, b: 0.5 + (b - a) * 0.03, {t: t for t in teams})
+    for rnd, alive in enumerate((4, 2, 1)):
+        assert sum(odds[t][rnd] for t in teams) == pytest.approx(alive)
+
+
+def test_bracket_rejects_non_power_of_two():
+    with pytest.raises(ValueError):
+        bracket_odds([1, 2, 3], lambda a, b: 0.5, {1: 0, 2: 1, 3: 2})
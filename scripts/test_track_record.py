@@ -0,0 +1,55 @@
+import random
+
+from track_record import band_key, empty_record, load_record, publish, roll_up
+
+
+def _history(n, seed=3):
+    rng = random.Random(seed)
+    hist = []
+    for i in range(n):
+        p = rng.uniform(0.45, 0.8)
+        hist.append({
+            "game_id": 2023020000 + i,
+            "game_date": f"2024-{1 + i // 120:02d}-{1 + (i // 4) % 28:02d}",
+            "p_full": round(p, 4),
+            "resolved": True,
+            "outcome": int(rng.random() < p),
+        })
+    return hist
+
+
+def test_incremental_rollups_match_full_recompute():
+    hist = _history(400)
+    full = empty_record()
+    roll_up(full, [dict(r) for r in hist])
+
+    saved = None
+    chunked = [dict(r) for r in hist]
+    for lo in range(0, len(chunked), 37):
+        record = load_record(saved)
+        roll_up(record, chunked[:lo + 37])
+        saved = publish(record)
+
+    assert saved == publish(full)
+
+
+def test_rolled_up_picks_are_not_counted_twice():
+    hist = _history(50)
+    record = empty_record()
+    assert roll_up(record, hist) == 50
+    assert roll_up(record, hist) == 0
+    assert record["overall"]["n"] == 50
+
+
+def test_band_keys_cover_low_probabilities():
+    assert band_key(0.42) == "<0.50"
+    assert band_key(0.50) == "0.50-0.55"
+    assert band_key(0.71) == "0.70+"
+    bands = list(publish(_roll(_history(300)))["bands"])
+    assert bands[0] == "<0.50" and bands[-1] == "0.70+"
+
+
+def _roll(hist):
+    record = empty_record()
+    roll_up(record, hist)
+    return record
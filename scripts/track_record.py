@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Iterable, List
+
+# Edges of the published-probability bands; both ends are open-ended (calibrated
+# probabilities can fall below 0.50 even though the pick side is chosen on raw p)
+BAND_EDGES = (0.50, 0.55, 0.60, 0.65, 0.70)
+RECENT_DAYS = 60   # per-day rows kept in the public summary (months/bands keep everything)
+VERSION = 2        # bump when rollup keys change; older summaries are rebuilt from history
+
+
+def empty_record() -> dict:
+    return {
+        "overall": _acc(),
+        "months": {},
+        "bands": {},
+        "days": {},
+        "streak": {"current": 0, "longest_win": 0, "longest_loss": 0},
+        "updated_through": None,
+    }
+
+
+def _acc() -> dict:
+    return {"n": 0, "hits": 0, "brier_sum": 0.0, "p_sum": 0.0}
+
+
+def band_key(p: float) -> str:
+    edges = BAND_EDGES
+    if p < edges[0]:
+        return f"<{edges[0]:.2f}"
+    for lo, hi in zip(edges, edges[1:]):
+        if p < hi:
+            return f"{lo:.2f}-{hi:.2f}"
+    return f"{edges[-1]:.2f}+"
+
+
+def _band_order(key: str) -> float:
+    return -1.0 if key.startswith("<") else float(key[:4])
+
+
+def _add(acc: dict, p: float, hit: int) -> None:
+    acc["n"] += 1
+    acc["hits"] += hit
+    acc["brier_sum"] = round(acc["brier_sum"] + (p - hit) ** 2, 6)
+    acc["p_sum"] = round(acc["p_sum"] + p, 6)
+
+
+def roll_up(record: dict, hist: Iterable[dict]) -> int:
+    """Fold every resolved, not-yet-rolled-up pick into `record`; returns how many.
+
+    Picks are applied in (game_date, game_id) order so the streak follows the
+    schedule; each one is flagged `rolled_up` so the next run skips it.
+    """
+    fresh: List[dict] = [
+        rec for rec in hist
+        if rec.get("resolved") is True and rec.get("outcome") is not None and not rec.get("rolled_up")
+    ]
+    fresh.sort(key=lambda rec: (str(rec.get("game_date")), int(rec.get("game_id") or 0)))
+    streak = record["streak"]
+    for rec in fresh:
+        p = rec.get("p_full") if rec.get("p_full") is not None else rec.get("p_full_raw", 0.5)
+        p = min(1.0, max(0.0, float(p)))
+        hit = int(rec["outcome"])
+        day = str(rec.get("game_date"))
+        for acc in (
+            record["overall"],
+            record["months"].setdefault(day[:7], _acc()),
+            record["bands"].setdefault(band_key(p), _acc()),
+            record["days"].setdefault(day, _acc()),
+        ):
+            _add(acc, p, hit)
+
+        cur = streak["current"]
+        cur = (cur + 1 if cur > 0 else 1) if hit else (cur - 1 if cur < 0 else -1)
+        streak["current"] = cur
+        streak["longest_win"] = max(streak["longest_win"], cur)
+        streak["longest_loss"] = max(streak["longest_loss"], -cur)
+        record["updated_through"] = max(record["updated_through"] or day, day)
+        rec["rolled_up"] = True
+    return len(fresh)
+
+
+def _rates(acc: dict) -> dict:
+    n = acc["n"]
+    out = dict(acc)
+    if n:
+        out["hit_rate"] = round(acc["hits"] / n, 4)
+        out["brier"] = round(acc["brier_sum"] / n, 4)
+        out["avg_p"] = round(acc["p_sum"] / n, 4)
+    return out
+
+
+def publish(record: dict, recent_days: int = RECENT_DAYS) -> dict:
+    """Trim per-day rows to the most recent `recent_days` and attach derived rates.
+
+    The result is both the site's summary and next run's starting point: the raw
+    sums stay alongside the rates, which are recomputed on every publish.
+    """
+    days = dict(sorted(record["days"].items())[-recent_days:])
+    return {
+        "version": VERSION,
+        "overall": _rates(record["overall"]),
+        "months": {k: _rates(v) for k, v in sorted(record["months"].items())},
+        "bands": {k: _rates(v) for k, v in sorted(record["bands"].items(), key=lambda kv: _band_order(kv[0]))},
+        "days": {k: _rates(v) for k, v in days.items()},
+        "streak": dict(record["streak"]),
+        "updated_through": record["updated_through"],
+    }
+
+
+def load_record(saved: dict | None) -> dict:
+    """Starting accumulators from a published summary (derived rate fields are dropped)."""
+    record = empty_record()
+    if not saved:
+        return record
+    keep = tuple(_acc())
+
+    def strip(acc: dict) -> dict:
+        return {k: acc.get(k, 0) for k in keep}
+
+    record["overall"] = strip(saved.get("overall") or {})
+    for key in ("months", "bands", "days"):
+        record[key] = {k: strip(v) for k, v in (saved.get(key) or {}).items()}
+    record["streak"].update(saved.get("streak") or {})
+    record["updated_through"] = saved.get("updated_through")
+    return record
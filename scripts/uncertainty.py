@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+def recency_weight_matrix(n: np.ndarray, weights: Sequence[float], width: int) -> np.ndarray:
+    """Row i holds weights[-n_i:] in its first n_i columns (logs are stored oldest first)."""
+    w = np.asarray(weights, dtype=float)
+    out = np.zeros((len(n), width))
+    for i, k in enumerate(n):
+        if k > 0:
+            out[i, :k] = w[-k:]
+    return out
+
+
+def resampled_form_points(res: np.ndarray, gd: np.ndarray, n: np.ndarray, weights: Sequence[float],
+                          res_to_pts: float, gd_to_pts: float, cap: float, samples: int,
+                          rng: np.random.Generator) -> np.ndarray:
+    """Bootstrap each side's last-10 log (with replacement) -> (samples, sides) form points.
+
+    res/gd are (sides, 10) left-aligned; resampled games keep the recency weight of
+    the slot they land in, so the point estimate matches form_points.
+    """
+    sides, width = res.shape
+    idx = (rng.random((samples, sides, width)) * np.maximum(n, 1)[None, :, None]).astype(np.int64)
+    rows = np.arange(sides)[None, :, None]
+    wm = recency_weight_matrix(n, weights, width)
+    den = np.where(wm.sum(axis=1) > 0, wm.sum(axis=1), 1.0)
+    res_avg = (res[rows, idx] * wm).sum(axis=2) / den
+    gd_avg = (gd[rows, idx] * wm).sum(axis=2) / den
+    pts = np.clip(res_avg * res_to_pts + gd_avg * gd_to_pts, -cap, cap)
+    return np.where(n[None, :] > 0, pts, 0.0)
+
+
+def resampled_home_adv(mean: np.ndarray, sd: np.ndarray, n: np.ndarray, base: float, learn_rate: float,
+                       k: float, lo: float, hi: float, samples: int, rng: np.random.Generator) -> np.ndarray:
+    """Sampling distribution of get_team_home_adv: mean home residual ~ N(mean, sd/sqrt(n))."""
+    se = sd / np.sqrt(np.maximum(n, 1))
+    avg = mean[None, :] + se[None, :] * rng.standard_normal((samples, len(mean)))
+    strength = np.where(n > 0, n / (n + k), 0.0)
+    return np.clip(base + avg * learn_rate * strength[None, :], lo, hi)
+
+
+def resampled_goalie_points(sv: np.ndarray, shots: np.ndarray, shrink: np.ndarray, league_avg: float,
+                            pts_per_010: float, cap: float, samples: int, rng: np.random.Generator) -> np.ndarray:
+    """Binomial resample of each starter's SV% window -> (samples, sides) goalie points (0 if unknown)."""
+    shots = np.maximum(shots, 0).astype(np.int64)
+    saves = rng.binomial(shots[None, :], np.clip(sv, 0.0, 1.0)[None, :], size=(samples, len(sv)))
+    sv_s = saves / np.maximum(shots, 1)[None, :]
+    pts = np.clip((sv_s - league_avg) / 0.010 * pts_per_010 * shrink[None, :], -cap, cap)
+    return np.where(shots[None, :] > 0, pts, 0.0)
+
+
+def home_prob(diff: np.ndarray, scale: float, shrink: float) -> np.ndarray:
+    return 0.5 + (1.0 / (1.0 + 10.0 ** (-diff / scale)) - 0.5) * shrink
+
+
+def percentile_band(p: np.ndarray, level: float) -> Dict[str, np.ndarray]:
+    tail = (1.0 - level) / 2.0 * 100.0
+    lo, hi = np.percentile(p, [tail, 100.0 - tail], axis=0)
+    return {"lo": lo, "hi": hi}